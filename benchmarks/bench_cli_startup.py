@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark: how fast festy-crew subcommands get going.
+
+Runs each command in a fresh interpreter with `python -X importtime`, printing
+the median wall time, total import time and whether crewai or pandas were
+loaded. Light commands (--help, list-approved, stats) must not load either;
+the script exits non-zero if they do. Importing the phase 2 module is
+included as the old per-script baseline.
+
+Usage: python benchmarks/bench_cli_startup.py [--runs 5]
+"""
+
+import argparse
+import csv
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+HEAVY = ("crewai", "pandas")
+
+
+def _run(argv, runs: int):
+    walls, imports, heavy, status = [], [], set(), 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", *argv], capture_output=True, text=True
+        )
+        walls.append(time.perf_counter() - start)
+        status = status or proc.returncode
+        total = 0
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            _, cumulative, module = line[len("import time:"):].split("|")
+            if not cumulative.strip().isdigit():
+                continue  # header line
+            name = module.strip()
+            if module == f" {name}":
+                total += int(cumulative)  # unindented = top level; nested ones are included
+            heavy.update(h for h in HEAVY if name.split(".")[0] == h)
+        imports.append(total / 1e6)
+    return statistics.median(walls), statistics.median(imports), sorted(heavy), status
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sample = os.path.join(tmp, "festivals.csv")
+        with open(sample, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["name", "country", "website", "genre_fit_score", "Approved"])
+            for i in range(500):
+                writer.writerow([f"Festival {i}", "Japan", f"https://fest{i}.jp", "High", "Yes" if i % 3 else ""])
+
+        cases = [
+            ("festy-crew --help", ["-m", "festy_crew", "--help"], True),
+            ("festy-crew enrich --help", ["-m", "festy_crew", "enrich", "--help"], True),
+            ("festy-crew list-approved", ["-m", "festy_crew", "list-approved", sample], True),
+            ("festy-crew stats", ["-m", "festy_crew", "stats", sample], True),
+            ("import festy_crew.phase2", ["-c", "import festy_crew.phase2"], False),
+        ]
+
+        failed = False
+        print(f"{'command':<28} {'wall':>8} {'imports':>8}  heavy modules")
+        for label, argv, light in cases:
+            wall, imported, heavy, status = _run(argv, args.runs)
+            note = f"  (exit status {status})" if status else ""
+            print(f"{label:<28} {wall:7.3f}s {imported:7.3f}s  {', '.join(heavy) or '-'}{note}")
+            failed |= light and bool(heavy)
+
+    if failed:
+        print("A light command imported crewai or pandas.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: LLM tokens per scraped page, fixed cut-offs vs select_content.
+
+Generates festival-site pages in markdown (navigation, hero text, line-up,
+ticket links, contact details, long footers) and compares what reaches the
+LLM when each page is cut at the old 3000/1500/2000 characters with what
+select_content keeps under the current token budgets. Tokens are estimated
+at 4 characters each; emails kept out of emails on the page are shown too.
+
+Usage: python benchmarks/bench_content_select.py [--pages 300] [--seed 1]
+"""
+
+import argparse
+import random
+import re
+
+from festy_crew.tools.content_select import CHARS_PER_TOKEN, select_content
+from festy_crew.tools.firecrawl_tool import (
+    CONTACT_PAGE_TOKEN_BUDGET,
+    HOMEPAGE_TOKEN_BUDGET,
+    SCRAPE_TOKEN_BUDGET,
+)
+
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+
+# (page kind, old cut-off in characters, current token budget)
+KINDS = [
+    ("scrape", 3000, SCRAPE_TOKEN_BUDGET),
+    ("contact page", 1500, CONTACT_PAGE_TOKEN_BUDGET),
+    ("homepage", 2000, HOMEPAGE_TOKEN_BUDGET),
+]
+WORDS = "sound wave city summer night island garden live music weekend indie pop art stage august".split()
+ROLES = ["Booking", "Press", "Festival Director", "Artist Relations", "Partnerships"]
+
+
+def _nav(rng: random.Random, n: int) -> str:
+    return "\n".join(
+        f"- [{rng.choice(WORDS).title()}](https://fest.example/{rng.choice(WORDS)}/{i})" for i in range(n)
+    )
+
+
+def _prose(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def make_page(rng: random.Random) -> str:
+    domain = f"{rng.choice(WORDS)}{rng.randint(1, 99)}.jp"
+    blocks = [f"# {rng.choice(WORDS).title()} Festival {rng.randint(2025, 2027)}", _nav(rng, rng.randint(8, 30))]
+    blocks += [_prose(rng, rng.randint(30, 90)) for _ in range(rng.randint(1, 4))]
+    blocks.append("## Line-up\n" + ", ".join(f"Artist {i}" for i in range(rng.randint(10, 60))))
+    blocks.append(_nav(rng, rng.randint(5, 15)))  # ticket and shop links
+    contacts = rng.sample(ROLES, rng.randint(1, 3))
+    blocks.append(
+        "## Contact\n"
+        + "\n".join(f"{role}: {role.split()[0].lower()}@{domain}" for role in contacts)
+        + f"\nTel: +81 3 {rng.randint(1000, 9999)} {rng.randint(1000, 9999)}"
+    )
+    blocks += [_prose(rng, rng.randint(20, 60)) for _ in range(rng.randint(0, 3))]
+    blocks.append(_nav(rng, rng.randint(15, 40)))  # footer
+    blocks.append("We use cookies. " + _prose(rng, 40))
+    rng.shuffle(blocks[2:-2])
+    return "\n\n".join(blocks)
+
+
+def _emails(text: str) -> set:
+    return {m.lower() for m in _EMAIL_RE.findall(text)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    pages = [make_page(rng) for _ in range(args.pages)]
+    print(f"{args.pages} pages, mean {sum(map(len, pages)) / len(pages) / CHARS_PER_TOKEN:.0f} tokens each\n")
+    for kind, cutoff, budget in KINDS:
+        old = [page[:cutoff] for page in pages]
+        new = [select_content(page, budget) for page in pages]
+        found = sum(len(_emails(page)) for page in pages)
+        old_tokens = sum(map(len, old)) / len(pages) / CHARS_PER_TOKEN
+        new_tokens = sum(map(len, new)) / len(pages) / CHARS_PER_TOKEN
+        old_kept = sum(len(_emails(text)) for text in old) / found
+        new_kept = sum(len(_emails(text)) for text in new) / found
+        print(
+            f"{kind:<13} cut at {cutoff} chars: {old_tokens:6.0f} tokens/page, {old_kept:6.1%} of emails   "
+            f"select_content({budget}): {new_tokens:6.0f} tokens/page, {new_kept:6.1%} of emails   "
+            f"({1 - new_tokens / old_tokens:.0%} fewer tokens)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: per-festival crew setup, rebuilt from scratch vs cloned.
+
+Compares building EnrichmentCrew().crew() for every festival (YAML parsing,
+agents, tasks and tools each time) with enrichment_crew(), which copies a
+template built once. Nothing is kicked off, so no API calls are made.
+
+Usage: python benchmarks/bench_crew_setup.py [--festivals 1000]
+"""
+
+import argparse
+import os
+import time
+
+# Placeholder keys so agents and tools can be constructed offline
+os.environ.setdefault("OPENAI_API_KEY", "sk-bench")
+os.environ.setdefault("SERPER_API_KEY", "bench")
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+from festy_crew.enrichment_crew.crew import EnrichmentCrew, enrichment_crew
+
+
+def _time(label: str, build, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        build()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:8.2f}s total  {elapsed / n * 1000:8.2f} ms/festival")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--festivals", type=int, default=1000)
+    args = parser.parse_args()
+
+    enrichment_crew(verbose=False)  # build the template outside the timed loop
+    rebuilt = _time("EnrichmentCrew().crew()", lambda: EnrichmentCrew().crew(), args.festivals)
+    cloned = _time("enrichment_crew() (clone)", lambda: enrichment_crew(verbose=False), args.festivals)
+    print(f"Speed-up: {rebuilt / cloned:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
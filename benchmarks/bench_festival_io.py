@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark: loading approved festivals from CSV vs Parquet at scale.
+
+Writes a synthetic phase 1 dataset (long description/why_it_fits/known_acts
+text, about 1 in 5 rows approved) as CSV and as Parquet, then loads the
+approved festivals each way in a fresh interpreter: every column, or only the
+columns phase 2 needs (ENRICH_COLUMNS). Prints median load time and peak RSS
+growth over the interpreter's baseline. Needs pyarrow and Linux (/proc).
+
+Usage: python benchmarks/bench_festival_io.py [--rows 100000] [--runs 3]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from festy_crew.utils.csv_handler import PARQUET_ROW_GROUP, parquet_path
+from festy_crew.utils.festival_key import festival_key
+
+# ru_maxrss survives fork/exec, so the loader resets the kernel's high-water
+# mark (Linux) after its imports and reads VmHWM from /proc instead
+_LOADER = """
+import json, sys, time
+from festy_crew.utils.csv_handler import ENRICH_COLUMNS, load_approved_festivals
+import pyarrow.parquet  # imported up front so it counts towards the baseline
+
+def status_kb(field):
+    with open("/proc/self/status") as f:
+        return next(int(line.split()[1]) for line in f if line.startswith(field))
+
+path, pruned = sys.argv[1], sys.argv[2] == "1"
+with open("/proc/self/clear_refs", "w") as f:
+    f.write("5")
+baseline = status_kb("VmRSS:")
+start = time.perf_counter()
+records = load_approved_festivals(path, columns=ENRICH_COLUMNS if pruned else None)
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "peak_kb": status_kb("VmHWM:") - baseline, "rows": len(records)}))
+"""
+
+
+def _dataset(rows: int) -> pd.DataFrame:
+    filler = "Lo-fi dream pop and shoegaze acts on an intimate riverside stage. " * 6
+    df = pd.DataFrame({
+        "name": [f"Festival {i}" for i in range(rows)],
+        "country": [("Japan", "Korea", "Thailand", "Taiwan")[i % 4] for i in range(rows)],
+        "location": [f"City {i % 300}" for i in range(rows)],
+        "dates": "August 2026",
+        "genres": "indie pop, dream pop, shoegaze",
+        "website": [f"https://fest{i}.example.com" for i in range(rows)],
+        "description": [f"{filler}#{i}" for i in range(rows)],
+        "genre_fit_score": [("High", "Medium", "Low")[i % 3] for i in range(rows)],
+        "why_it_fits": [f"{filler[:250]}#{i}" for i in range(rows)],
+        "known_acts": "Band A, Band B, Band C, Band D, Band E, Band F",
+        "submission_info": "",
+    })
+    df["festival_key"] = [festival_key(n, w) for n, w in zip(df["name"], df["website"])]
+    df["Approved"] = ["Yes" if i % 5 == 0 else "" for i in range(rows)]
+    return df
+
+
+def _load(path: str, pruned: bool, runs: int):
+    results = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-c", _LOADER, path, "1" if pruned else "0"],
+            capture_output=True, text=True, check=True,
+        )
+        results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return (
+        statistics.median(r["seconds"] for r in results),
+        statistics.median(r["peak_kb"] for r in results) / 1024,
+        results[0]["rows"],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "festivals.csv")
+        start = time.perf_counter()
+        df = _dataset(args.rows)
+        df.to_csv(csv_path, index=False)
+        df.astype("string").to_parquet(parquet_path(csv_path), index=False, row_group_size=PARQUET_ROW_GROUP)
+        del df
+        print(f"Wrote {args.rows} rows in {time.perf_counter() - start:.1f}s: "
+              f"CSV {os.path.getsize(csv_path) / 1e6:.1f} MB, "
+              f"Parquet {os.path.getsize(parquet_path(csv_path)) / 1e6:.1f} MB")
+
+        print(f"{'format':<9} {'columns':<9} {'load':>8} {'peak RSS':>10} {'approved':>9}")
+        for label, path in (("CSV", csv_path), ("Parquet", parquet_path(csv_path))):
+            for pruned in (False, True):
+                seconds, peak_mb, rows = _load(path, pruned, args.runs)
+                columns = "enrich" if pruned else "all"
+                print(f"{label:<9} {columns:<9} {seconds:7.2f}s {peak_mb:8.0f}MB {rows:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: bare requests.get vs the shared pooled session.
+
+Starts a local keep-alive stub server and issues the same number of requests
+through each client from a small thread pool, printing requests per second.
+
+Usage: python benchmarks/bench_http_pool.py [--requests 2000] [--threads 8]
+"""
+
+import argparse
+import concurrent.futures
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from festy_crew.tools.clients import get_http_session
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections open between requests
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out in separate writes; avoid Nagle/delayed-ACK stalls
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        body = b'{"data": {"status": "valid", "score": 99}}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _run(get, url: str, n: int, threads: int) -> float:
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as pool:
+        for resp in pool.map(lambda _: get(url, timeout=10), range(n)):
+            resp.raise_for_status()
+    return n / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/v2/email-verifier"
+
+    try:
+        bare = _run(requests.get, url, args.requests, args.threads)
+        pooled = _run(get_http_session("bench").get, url, args.requests, args.threads)
+    finally:
+        server.shutdown()
+
+    print(f"bare requests.get : {bare:8.0f} req/s")
+    print(f"pooled session    : {pooled:8.0f} req/s  ({pooled / bare:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
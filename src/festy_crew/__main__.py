@@ -0,0 +1,3 @@
+from festy_crew.cli import main
+
+main()
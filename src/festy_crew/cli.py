@@ -0,0 +1,345 @@
+"""
+festy-crew command line.
+
+  festy-crew discover        Phase 1: discover festivals (see festy_crew.phase1)
+  festy-crew enrich          Phase 2: enrich approved festivals (see festy_crew.phase2)
+  festy-crew list-approved   List the festivals marked approved in a CSV
+  festy-crew stats           Summarise a phase 1/phase 2 CSV or a metrics report
+  festy-crew export          Write the festival store out as a phase 1 CSV
+  festy-crew import          Load festivals and approvals from a CSV into the store
+
+Only the standard library is imported up front. crewai, the tools and pandas
+load inside the subcommands that need them, so --help and the read-only
+subcommands start quickly.
+"""
+
+import argparse
+import csv
+import json
+import sys
+from collections import Counter
+from typing import List, Optional
+
+
+def add_discover_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--output",
+        default="festivals_phase1.csv",
+        help="Output CSV file path (default: festivals_phase1.csv)",
+    )
+    parser.add_argument(
+        "--parquet",
+        action="store_true",
+        help="Also write a Parquet copy of the output next to the CSV (needs pyarrow)",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="CASSETTE",
+        help="Record all LLM and tool calls to a cassette file for offline replay",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="CASSETTE",
+        help="Run offline, serving LLM and tool calls from a recorded cassette",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the on-disk scrape cache",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached pages and re-scrape, updating the cache",
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_DIR",
+        help="Resume from a checkpointed run directory (e.g. runs/phase1-20260101-120000)",
+    )
+    parser.add_argument(
+        "--from-task",
+        choices=["discover", "score", "parse"],
+        help=(
+            "Stage to restart from when resuming: 'score' re-scores the saved discovery "
+            "output, 'parse' only rebuilds the CSV (default: first unfinished stage)"
+        ),
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=0,
+        help="Split discovery into N country groups run as separate crews (default: 0, unsharded)",
+    )
+    parser.add_argument(
+        "--shard-concurrency",
+        type=int,
+        help="Number of shards to run at once (default: all)",
+    )
+    parser.add_argument(
+        "--shard-retries",
+        type=int,
+        default=1,
+        help="Times to retry a failed shard on its own (default: 1)",
+    )
+    parser.add_argument(
+        "--metrics",
+        nargs="?",
+        const="metrics.json",
+        metavar="PATH",
+        help="Record per-tool and per-shard timings, errors and token usage to a JSON "
+        "report (default path: metrics.json)",
+    )
+
+
+def check_discover_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    if args.from_task and args.from_task != "discover" and not args.resume:
+        parser.error("--from-task score/parse requires --resume")
+    if args.from_task and args.shards > 1:
+        parser.error("--from-task applies to unsharded runs; sharded resumes pick up each shard where it stopped")
+
+
+def add_enrich_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "csv_path",
+        nargs="?",
+        default="festivals_phase1.csv",
+        help="Phase 1 CSV or Parquet file with an 'Approved' column (default: festivals_phase1.csv)",
+    )
+    parser.add_argument(
+        "--output",
+        default="festivals_phase2_enriched.csv",
+        help="Output CSV file path (default: festivals_phase2_enriched.csv)",
+    )
+    parser.add_argument(
+        "--parquet",
+        action="store_true",
+        help="Also write a Parquet copy of the output next to the CSV (needs pyarrow)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of festivals to enrich at once (default: 1)",
+    )
+    parser.add_argument(
+        "--no-fast-path",
+        action="store_true",
+        help="Always run the full LLM crew instead of trying contact pages and Hunter first",
+    )
+    parser.add_argument(
+        "--festival-budget",
+        type=float,
+        default=300,
+        metavar="SECONDS",
+        help="Time budget shared by all of one festival's scrapes and lookups; when it runs out "
+        "the festival is saved with what was found so far (default: 300; 0 = unlimited)",
+    )
+    parser.add_argument(
+        "--max-age",
+        type=float,
+        default=30,
+        metavar="DAYS",
+        help="Re-enrich festivals whose stored result is older than this (default: 30; 0 redoes all)",
+    )
+    parser.add_argument(
+        "--progress",
+        help="JSONL file each festival's result is appended to as it finishes "
+        "(default: <output>.progress.jsonl)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip festivals already recorded in the progress file",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="CASSETTE",
+        help="Record all LLM and tool calls to a cassette file for offline replay",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="CASSETTE",
+        help="Run offline, serving LLM and tool calls from a recorded cassette",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the on-disk scrape and Hunter caches",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached pages and Hunter results and refetch, updating the caches",
+    )
+    parser.add_argument(
+        "--metrics",
+        nargs="?",
+        const="metrics.json",
+        metavar="PATH",
+        help="Record per-tool and per-festival timings, errors and token usage to a JSON "
+        "report (default path: metrics.json)",
+    )
+
+
+def _read_rows(csv_path: str) -> List[dict]:
+    """Rows of a festival CSV, skipping the disclaimer comment phase 2 appends."""
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(line for line in f if not line.startswith("#")))
+
+
+def _is_approved(row: dict) -> bool:
+    return (row.get("Approved") or "").strip().lower() == "yes"
+
+
+def list_approved(args: argparse.Namespace) -> int:
+    try:
+        rows = _read_rows(args.csv_path)
+    except FileNotFoundError:
+        print(f"Error: CSV file not found at {args.csv_path}")
+        return 1
+    if rows and "Approved" not in rows[0]:
+        print(f"No 'Approved' column in {args.csv_path}; mark festivals with 'Yes' first.")
+        return 1
+
+    from festy_crew.utils.festival_key import festival_key
+
+    approved = [row for row in rows if _is_approved(row)]
+    for row in approved:
+        key = row.get("festival_key") or festival_key(row.get("name", ""), row.get("website", ""))
+        print(f"{key}  {row.get('name', ''):<40} {row.get('country', ''):<14} {row.get('website', '')}")
+    print(f"{len(approved)} of {len(rows)} festivals approved")
+    return 0
+
+
+def _counts(values, limit: Optional[int] = None) -> str:
+    counts = Counter(v or "(blank)" for v in values).most_common(limit)
+    return ", ".join(f"{value} {n}" for value, n in counts)
+
+
+def stats(args: argparse.Namespace) -> int:
+    if args.csv_path:
+        try:
+            rows = _read_rows(args.csv_path)
+        except FileNotFoundError:
+            print(f"Error: CSV file not found at {args.csv_path}")
+            return 1
+        if rows and "Confidence" in rows[0]:
+            # Phase 2 output: one row per contact, festival metadata repeated
+            festivals = {}
+            for row in rows:
+                festivals.setdefault(row.get("festival_key") or row.get("name"), row)
+            emails = {row["Contact Email"] for row in rows if row.get("Contact Email")}
+            print(f"{args.csv_path}: {len(festivals)} festivals, {len(emails)} contact emails")
+            print(f"  Confidence: {_counts(r.get('Confidence') for r in festivals.values())}")
+        else:
+            print(f"{args.csv_path}: {len(rows)} festivals, "
+                  f"{sum(_is_approved(r) for r in rows)} approved")
+            print(f"  Genre fit: {_counts(r.get('genre_fit_score') for r in rows)}")
+            print(f"  Countries: {_counts((r.get('country') for r in rows), limit=8)}")
+
+    if args.metrics:
+        from festy_crew.utils.metrics import summary_lines
+
+        try:
+            with open(args.metrics, encoding="utf-8") as f:
+                report = json.load(f)
+        except FileNotFoundError:
+            print(f"Error: metrics report not found at {args.metrics}")
+            return 1
+        print(f"Slowest stages in {args.metrics}:")
+        print("\n".join(summary_lines(report=report)))
+    return 0
+
+
+def export_store(args: argparse.Namespace) -> int:
+    from festy_crew.store import get_festival_store
+
+    store = get_festival_store()
+    n = store.export_csv(args.csv_path, approved_only=args.approved_only)
+    print(f"Wrote {n} festivals from {store.path} to {args.csv_path}")
+    return 0
+
+
+def import_store(args: argparse.Namespace) -> int:
+    from festy_crew.store import get_festival_store
+
+    store = get_festival_store()
+    try:
+        new, updated = store.import_csv(args.csv_path)
+    except FileNotFoundError:
+        print(f"Error: CSV file not found at {args.csv_path}")
+        return 1
+    counts = store.counts()
+    print(f"Imported {args.csv_path} into {store.path}: {new} new, {updated} updated")
+    print(f"  Store now has {counts['festivals']} festivals, {counts['approved']} approved, "
+          f"{counts['enriched']} enriched")
+    return 0
+
+
+def discover(args: argparse.Namespace) -> int:
+    from festy_crew.phase1 import main as run_discovery
+
+    run_discovery(args)
+    return 0
+
+
+def enrich(args: argparse.Namespace) -> int:
+    from festy_crew.phase2 import main as run_enrichment
+
+    run_enrichment(args)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="festy-crew",
+        description="Discover indie-pop-aligned Asian music festivals and find organizer contacts",
+    )
+    commands = parser.add_subparsers(dest="command", required=True, metavar="COMMAND")
+
+    sub = commands.add_parser("discover", help="Phase 1: discover festivals into a CSV for review")
+    add_discover_arguments(sub)
+    sub.set_defaults(handler=discover)
+
+    sub = commands.add_parser("enrich", help="Phase 2: find organizer contacts for approved festivals")
+    add_enrich_arguments(sub)
+    sub.set_defaults(handler=enrich)
+
+    sub = commands.add_parser("list-approved", help="List festivals marked 'Yes' in the Approved column")
+    sub.add_argument(
+        "csv_path",
+        nargs="?",
+        default="festivals_phase1.csv",
+        help="Phase 1 CSV (default: festivals_phase1.csv)",
+    )
+    sub.set_defaults(handler=list_approved)
+
+    sub = commands.add_parser("stats", help="Summarise a phase 1/phase 2 CSV and/or a metrics report")
+    sub.add_argument("csv_path", nargs="?", help="Phase 1 or phase 2 CSV")
+    sub.add_argument("--metrics", metavar="PATH", help="Metrics report written with --metrics")
+    sub.set_defaults(handler=stats)
+
+    sub = commands.add_parser("export", help="Write the festival store out as a phase 1 CSV")
+    sub.add_argument("csv_path", help="CSV file to write")
+    sub.add_argument("--approved-only", action="store_true", help="Only export approved festivals")
+    sub.set_defaults(handler=export_store)
+
+    sub = commands.add_parser("import", help="Load festivals and approvals from a phase 1 CSV into the store")
+    sub.add_argument("csv_path", help="Phase 1 CSV or Parquet file; its Approved column replaces stored approvals")
+    sub.set_defaults(handler=import_store)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "discover":
+        check_discover_args(parser, args)
+    if args.command == "stats" and not (args.csv_path or args.metrics):
+        parser.error("stats needs a CSV path and/or --metrics")
+    sys.exit(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
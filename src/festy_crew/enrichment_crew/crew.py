@@ -1,10 +1,15 @@
+import threading
+from typing import Optional
+
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai_tools import SerperDevTool
 
 from festy_crew.models.festival import EnrichedContact
 from festy_crew.tools.firecrawl_tool import FirecrawlScrapeTool, WebsiteContactFinderTool
-from festy_crew.tools.hunter_tool import HunterDomainSearchTool, HunterEmailVerifierTool
+from festy_crew.tools.hunter_tool import HunterBatchEmailVerifierTool, HunterDomainSearchTool
+from festy_crew.tools.instrumented import budget_tools, instrument_tools
+from festy_crew.utils.replay import crew_llm, wrap_tools
 
 
 @CrewBase
@@ -18,7 +23,12 @@ class EnrichmentCrew:
     def contact_finder(self) -> Agent:
         return Agent(
             config=self.agents_config["contact_finder"],
-            tools=[WebsiteContactFinderTool(), FirecrawlScrapeTool(), SerperDevTool()],
+            tools=instrument_tools(
+                budget_tools(
+                    wrap_tools([WebsiteContactFinderTool(), FirecrawlScrapeTool(), SerperDevTool()])
+                )
+            ),
+            llm=crew_llm(),
             verbose=True,
         )
 
@@ -26,7 +36,10 @@ class EnrichmentCrew:
     def email_enricher(self) -> Agent:
         return Agent(
             config=self.agents_config["email_enricher"],
-            tools=[HunterDomainSearchTool(), HunterEmailVerifierTool()],
+            tools=instrument_tools(
+                budget_tools(wrap_tools([HunterDomainSearchTool(), HunterBatchEmailVerifierTool()]))
+            ),
+            llm=crew_llm(),
             verbose=True,
         )
 
@@ -51,3 +64,29 @@ class EnrichmentCrew:
             process=Process.sequential,
             verbose=True,
         )
+
+
+_template: Optional[Crew] = None
+_template_lock = threading.Lock()
+
+
+def enrichment_crew(verbose: bool = True) -> Crew:
+    """Return a fresh enrichment crew for one festival, cloned from a shared template.
+
+    The YAML config is parsed and the agents, tasks and tools are built once per
+    process. Each call returns a copy with its own agents, tasks and token
+    counters, so no interpolated inputs or outputs carry over between
+    festivals. Tools are stateless and shared by all copies. Build the first
+    crew only after record/replay and metrics are configured, because their
+    tool wrappers are fixed in the template.
+    """
+    global _template
+    with _template_lock:
+        if _template is None:
+            _template = EnrichmentCrew().crew()
+        crew = _template.copy()
+    if not verbose:
+        crew.verbose = False
+        for crew_agent in crew.agents:
+            crew_agent.verbose = False
+    return crew
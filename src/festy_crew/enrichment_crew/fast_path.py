@@ -0,0 +1,118 @@
+import re
+from typing import Dict, List, Optional
+
+from festy_crew.models.festival import EnrichedContact, IndividualContact
+from festy_crew.tools.firecrawl_tool import _EMAIL_RE, WebsiteContactFinderTool
+from festy_crew.tools.hunter_tool import _domain_search, _get_hunter_key
+from festy_crew.utils.festival_key import normalize_domain
+from festy_crew.utils.replay import cassette_call, get_cassette
+
+
+_NOT_EMAIL_TLDS = ("png", "jpg", "jpeg", "gif", "svg", "webp", "css", "js")
+
+# (pattern, role) checked against the mailbox name, then the text just before it
+ROLE_HINTS = [
+    (re.compile(r"book", re.I), "Booking"),
+    (re.compile(r"submi|artist|apply|applica|demo", re.I), "Submissions"),
+    (re.compile(r"press|media|\bpr\b", re.I), "Press & Media"),
+    (re.compile(r"director|founder|ceo|organi[sz]er", re.I), "Festival Director"),
+    (re.compile(r"partner|sponsor", re.I), "Partnerships"),
+    (re.compile(r"info|contact|hello|enquir|inquir|general", re.I), "General"),
+]
+_CONTEXT_CHARS = 80
+
+
+def _role_hint(email: str, text: str, position: int) -> str:
+    local = email.split("@")[0]
+    context = text[max(0, position - _CONTEXT_CHARS):position]
+    for source in (local, context):
+        for pattern, role in ROLE_HINTS:
+            if pattern.search(source):
+                return role
+    return ""
+
+
+def extract_site_contacts(text: str, domain: str) -> List[IndividualContact]:
+    """Role-tagged emails found in scraped pages, limited to the festival's own domain."""
+    contacts: Dict[str, IndividualContact] = {}
+    for match in _EMAIL_RE.finditer(text):
+        email = match.group(0).strip(".").lower()
+        host = email.split("@")[1]
+        if host.rsplit(".", 1)[-1] in _NOT_EMAIL_TLDS:
+            continue
+        if domain and not (host == domain or host.endswith(f".{domain}")):
+            continue
+        if email not in contacts:
+            contacts[email] = IndividualContact(
+                role=_role_hint(email, text, match.start()), email=email
+            )
+    return list(contacts.values())
+
+
+def hunter_contacts(domain: str) -> List[dict]:
+    """Hunter domain-search entries for ``domain``; empty if Hunter is unavailable."""
+    api_key = _get_hunter_key()
+    if not domain or not (api_key or get_cassette()):
+        return []
+    try:
+        data = cassette_call(
+            "hunter:domain-search",
+            {"domain": domain, "limit": 10},
+            lambda: _domain_search(domain, 10, api_key),
+        )
+        return data.get("emails", []) or []
+    except Exception:
+        return []
+
+
+def fast_enrich(festival_name: str, website: str) -> EnrichedContact:
+    """Build an EnrichedContact from contact pages and Hunter alone, with no LLM.
+
+    Confidence follows the enrichment task's rubric: "High" needs two or more
+    named contacts with Hunter-verified emails, "Medium" any named contact or a
+    role mailbox, otherwise "Low" (the caller should then escalate to the crew).
+    """
+    domain = normalize_domain(website)
+    page_text = cassette_call(
+        "tool:WebsiteContactFinderTool",
+        {"base_url": website},
+        lambda: WebsiteContactFinderTool()._run(website),
+    )
+
+    by_email: Dict[str, IndividualContact] = {
+        c.email: c for c in extract_site_contacts(page_text, domain)
+    }
+    verified = set()
+    for entry in hunter_contacts(domain):
+        email = (entry.get("value") or "").lower()
+        if not email:
+            continue
+        name = f"{entry.get('first_name') or ''} {entry.get('last_name') or ''}".strip()
+        existing: Optional[IndividualContact] = by_email.get(email)
+        by_email[email] = IndividualContact(
+            name=name or (existing.name if existing else ""),
+            role=entry.get("position") or (existing.role if existing else ""),
+            email=email,
+        )
+        if (entry.get("verification") or {}).get("status") == "valid":
+            verified.add(email)
+
+    contacts = list(by_email.values())
+    named = [c for c in contacts if c.name]
+    if len([c for c in named if c.email in verified]) >= 2:
+        confidence = "High"
+    elif contacts:
+        confidence = "Medium"
+    else:
+        confidence = "Low"
+
+    return EnrichedContact(
+        festival_name=festival_name,
+        contacts=contacts,
+        confidence=confidence,
+        source="website+hunter",
+        notes=(
+            f"Resolved without LLM: {len(contacts)} emails "
+            f"({len(named)} named, {len(verified)} Hunter-verified)."
+        ),
+    )
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Phase 1: Discover indie-pop-aligned Asian music festivals.
+
+Runs a two-agent CrewAI pipeline:
+  1. festival_researcher — searches and scrapes for festival candidates
+  2. genre_filter_analyst — scores and filters by indie alignment
+
+Outputs: festivals_phase1.csv (with an "Approved" column for user review)
+
+Festivals are also upserted into the festival store (festy_crew.store); ones
+approved in an earlier run come out already marked "Yes".
+
+Each task's output is checkpointed under runs/<run>/ so a failed run can be
+resumed with --resume <run-dir> [--from-task score|parse].
+
+With --shards N, discovery is split into N country groups that run as separate
+crews concurrently; their festival lists are merged into one CSV.
+"""
+
+import argparse
+import atexit
+import concurrent.futures
+import hashlib
+import json
+import sys
+from types import SimpleNamespace
+from typing import List, Optional
+
+from dotenv import find_dotenv, load_dotenv
+
+load_dotenv(find_dotenv(usecwd=True))
+
+from festy_crew.cli import add_discover_arguments, check_discover_args
+from festy_crew.models.festival import Festival, FestivalList
+from festy_crew.research_crew.crew import ResearchCrew
+from festy_crew.research_crew.shards import COUNTRIES, GENERAL_PAGES, discovery_inputs, plan_shards
+from festy_crew.store import MEMORY_STORE, configure_festival_store, get_festival_store
+from festy_crew.tools.clients import close_clients
+from festy_crew.tools.scrape_cache import configure_scrape_cache
+from festy_crew.utils.checkpoint import RunCheckpoint
+from festy_crew.utils.csv_handler import extract_festivals, festivals_to_csv
+from festy_crew.utils.dedupe import dedupe_festivals
+from festy_crew.utils.metrics import (
+    enable_metrics,
+    metrics_scope,
+    record_tokens,
+    summary_lines,
+    timed,
+    write_metrics,
+)
+from festy_crew.utils.replay import configure_cassette
+
+
+BANNER = """
+╔══════════════════════════════════════════════════════════════╗
+║           festy-crew — Phase 1: Festival Discovery           ║
+║     Finding indie-pop-aligned Asian music festivals 2026     ║
+╚══════════════════════════════════════════════════════════════╝
+"""
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Discover indie-pop-aligned Asian music festivals for 2026"
+    )
+    add_discover_arguments(parser)
+    args = parser.parse_args(argv)
+    check_discover_args(parser, args)
+    return args
+
+
+DISCOVER_TASK = "discover_festivals_task"
+SCORE_TASK = "score_and_filter_festivals_task"
+
+
+def _next_stage(checkpoint: RunCheckpoint) -> str:
+    if checkpoint.is_complete(SCORE_TASK):
+        return "parse"
+    if checkpoint.is_complete(DISCOVER_TASK):
+        return "score"
+    return "discover"
+
+
+def _load_scored_output(checkpoint: RunCheckpoint):
+    """Rebuild a crew-output-like object from the saved scoring task output."""
+    structured = checkpoint.load_structured(SCORE_TASK)
+    return SimpleNamespace(
+        pydantic=FestivalList(**structured) if structured else None,
+        raw=checkpoint.load_raw(SCORE_TASK),
+    )
+
+
+def run_research(checkpoint: RunCheckpoint, stage: str, inputs: dict, verbose: bool = True):
+    """Run (or reload) the research pipeline from ``stage`` onwards."""
+    if stage == "parse":
+        return _load_scored_output(checkpoint)
+    research = ResearchCrew(checkpoint)
+    if stage == "score":
+        crew = research.scoring_crew(checkpoint.load_raw(DISCOVER_TASK))
+    else:
+        crew = research.crew()
+    if not verbose:
+        crew.verbose = False
+        for agent in crew.agents:
+            agent.verbose = False
+    with timed("crew.research"):
+        result = crew.kickoff(inputs=inputs)
+    record_tokens("crew.research", getattr(result, "token_usage", None))
+    return result
+
+
+SHARD_PLAN_FILE = "shard_plan.json"
+
+
+def _shard_plan(shard_inputs: List[dict]) -> dict:
+    regions = [si["regions"] for si in shard_inputs]
+    digest = hashlib.sha256(json.dumps(regions, ensure_ascii=False).encode("utf-8")).hexdigest()
+    return {"shards": len(shard_inputs), "regions_hash": digest[:16], "regions": regions}
+
+
+def shard_plan_mismatch(checkpoint: RunCheckpoint, shard_inputs: Optional[List[dict]]) -> Optional[str]:
+    """Why ``checkpoint`` can't be resumed with this shard plan (None = unsharded), if it can't.
+
+    The shard-XX checkpoints only apply to the country groups they were
+    planned with, so resuming with another --shards value would mix regions.
+    """
+    path = checkpoint.run_dir / SHARD_PLAN_FILE
+    if not path.exists():
+        return None
+    saved = json.loads(path.read_text())
+    if shard_inputs is None:
+        return (
+            f"{checkpoint.run_dir} is a sharded run ({saved['shards']} shards); "
+            f"resume it with --shards {saved['shards']}"
+        )
+    plan = _shard_plan(shard_inputs)
+    if (plan["shards"], plan["regions_hash"]) != (saved["shards"], saved["regions_hash"]):
+        return (
+            f"{checkpoint.run_dir} was split into {saved['shards']} shards with different regions; "
+            f"resume it with --shards {saved['shards']}"
+        )
+    return None
+
+
+def run_shards(
+    checkpoint: RunCheckpoint, num_shards: int, inputs: dict, concurrency: int, retries: int
+) -> FestivalList:
+    """Run one research crew per country group concurrently and merge their festivals.
+
+    Each shard checkpoints into its own subdirectory, so a retry (or a later
+    --resume) only repeats the stages that shard has not finished. The shard
+    plan is saved alongside so a resume can check it still matches.
+    """
+    shard_inputs = plan_shards(num_shards, inputs)
+    mismatch = shard_plan_mismatch(checkpoint, shard_inputs)
+    if mismatch:
+        raise ValueError(mismatch)
+    (checkpoint.run_dir / SHARD_PLAN_FILE).write_text(json.dumps(_shard_plan(shard_inputs), indent=2))
+    shards = [
+        RunCheckpoint(str(checkpoint.run_dir / f"shard-{i:02d}"), si)
+        for i, si in enumerate(shard_inputs, 1)
+    ]
+
+    def run_shard(index: int) -> List[Festival]:
+        with metrics_scope(f"shard-{index + 1:02d}"):
+            return _run_shard(index)
+
+    def _run_shard(index: int) -> List[Festival]:
+        shard = shards[index]
+        label = f"[shard {index + 1}/{len(shards)}: {shard.inputs['regions']}]"
+        for attempt in range(retries + 1):
+            stage = _next_stage(shard)
+            if attempt and stage == "parse":
+                stage = "score"  # saved scoring output didn't parse; score again
+            try:
+                festivals = extract_festivals(run_research(shard, stage, shard.inputs, verbose=False))
+                if not festivals:
+                    raise ValueError("no festivals could be parsed from the crew output")
+                print(f"{label} {len(festivals)} festivals", flush=True)
+                return festivals
+            except Exception as e:
+                retry = " — retrying" if attempt < retries else ""
+                print(f"{label} failed (attempt {attempt + 1}): {e}{retry}", flush=True)
+        return []
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+        per_shard = list(pool.map(run_shard, range(len(shards))))
+
+    failed = sum(1 for festivals in per_shard if not festivals)
+    if failed:
+        print(f"Warning: {failed} shard(s) produced no festivals; rerun with --resume to retry them.")
+    return FestivalList(festivals=[f for festivals in per_shard for f in festivals])
+
+
+def main(args: Optional[argparse.Namespace] = None):
+    print(BANNER)
+    if args is None:
+        args = parse_args()
+    atexit.register(close_clients)
+    try:
+        configure_cassette(record=args.record, replay=args.replay)
+    except (ValueError, FileNotFoundError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if args.record or args.replay:
+        # Recordings must cover every festival, and replays must not touch real results
+        configure_festival_store(MEMORY_STORE)
+        print("Record/replay run: using a temporary festival store.")
+    enable_metrics(bool(args.metrics))
+    cache = configure_scrape_cache(enabled=not args.no_cache, refresh=args.refresh)
+
+    base_inputs = {
+        "target_year": "2026",
+        "genre_focus": (
+            "indie pop, dream pop, shoegaze, synth-pop, chillwave, indie folk, "
+            "indie electronic, bedroom pop, indie rock, lo-fi"
+        ),
+    }
+    default_inputs = discovery_inputs(list(COUNTRIES), GENERAL_PAGES, base_inputs)
+
+    if args.resume:
+        try:
+            checkpoint = RunCheckpoint.resume(args.resume)
+        except FileNotFoundError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        inputs = {**default_inputs, **checkpoint.inputs}
+    else:
+        inputs = default_inputs
+        checkpoint = RunCheckpoint.new("phase1", inputs)
+    if args.resume:
+        mismatch = shard_plan_mismatch(
+            checkpoint, plan_shards(args.shards, inputs) if args.shards > 1 else None
+        )
+        if mismatch:
+            print(f"Error: {mismatch}")
+            sys.exit(1)
+
+    stage = args.from_task or _next_stage(checkpoint)
+
+    if stage == "score" and not checkpoint.is_complete(DISCOVER_TASK):
+        print(f"Error: no saved discovery output in {checkpoint.run_dir}; cannot resume from 'score'.")
+        sys.exit(1)
+    if stage == "parse" and not checkpoint.is_complete(SCORE_TASK):
+        print(f"Error: no saved scoring output in {checkpoint.run_dir}; cannot resume from 'parse'.")
+        sys.exit(1)
+
+    print(f"Run directory: {checkpoint.run_dir}")
+    if args.resume and args.shards <= 1:
+        print(f"Resuming from stage: {stage}")
+    print("Starting festival discovery...\n")
+    print(f"Target year: {inputs['target_year']}")
+    print(f"Regions: {inputs['regions']}")
+    print(f"Genre focus: {inputs['genre_focus']}")
+    if args.shards > 1:
+        print(f"Shards: {args.shards}")
+    print("\n" + "=" * 64)
+
+    try:
+        if args.shards > 1:
+            result = run_shards(
+                checkpoint,
+                args.shards,
+                inputs,
+                concurrency=args.shard_concurrency or args.shards,
+                retries=args.shard_retries,
+            )
+        else:
+            result = run_research(checkpoint, stage, inputs)
+    except Exception as e:
+        print(f"\nError running research crew: {e}")
+        print(f"Completed stages are saved; resume with: python phase1.py --resume {checkpoint.run_dir}")
+        sys.exit(1)
+
+    print("\n" + "=" * 64)
+    print("Research complete. Saving results...")
+
+    festivals = extract_festivals(result)
+    unique = dedupe_festivals(festivals)
+    if len(unique) < len(festivals):
+        print(f"Merged {len(festivals) - len(unique)} duplicate festival entries.")
+
+    store = get_festival_store()
+    new, updated = store.upsert_festivals(unique)
+    print(f"Festival store {store.path}: {new} new, {updated} already known.")
+
+    df = festivals_to_csv(
+        FestivalList(festivals=unique), args.output, approved_keys=store.approved_keys(), parquet=args.parquet
+    )
+
+    print(f"\n{'=' * 64}")
+    print(f"Results saved to: {args.output}")
+    print(f"Total festivals found: {len(df)}")
+
+    if not df.empty and "genre_fit_score" in df.columns:
+        high = (df["genre_fit_score"].str.lower() == "high").sum()
+        medium = (df["genre_fit_score"].str.lower() == "medium").sum()
+        print(f"  High fit:   {high}")
+        print(f"  Medium fit: {medium}")
+
+    if cache.enabled:
+        print(f"Scrape cache: {cache.hits} hits, {cache.misses} misses")
+    if args.metrics:
+        write_metrics(args.metrics)
+        print(f"\nSlowest stages (full report in {args.metrics}):")
+        print("\n".join(summary_lines()))
+
+    print(f"\n{'=' * 64}")
+    print("NEXT STEPS:")
+    print(f"  1. Open {args.output} in a spreadsheet editor")
+    print("  2. Review each festival entry")
+    print("  3. Add 'Approved' column with 'Yes' for festivals to enrich")
+    print(f"  4. Run: python phase2.py {args.output}")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Phase 2: Enrich approved festivals with organizer contact information.
+
+Reads approved festivals from Phase 1 CSV and, for each, first tries a fast
+path (contact pages + Hunter domain search, no LLM). Festivals that would come
+out "Low" confidence escalate to a two-agent enrichment pipeline:
+  1. contact_finder — crawls festival website for contact info
+  2. email_enricher — uses Hunter.io to find and verify emails
+
+Outputs: festivals_phase2_enriched.csv
+
+Use --concurrency N to enrich N festivals in parallel. Each result is appended
+to a progress file as soon as it is ready; --resume skips festivals already in it.
+
+Approvals and results are kept in the festival store (festy_crew.store), so
+festivals enriched within --max-age days are not enriched again. Without the
+CSV, every festival approved in the store is used.
+
+Each festival gets --festival-budget seconds for all of its scrapes and
+lookups; when it runs out the tools stop and the festival is saved with what
+was found so far, marked "Stopped early".
+"""
+
+import argparse
+import atexit
+import concurrent.futures
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import pandas as pd
+from dotenv import find_dotenv, load_dotenv
+
+load_dotenv(find_dotenv(usecwd=True))
+
+from festy_crew.cli import add_enrich_arguments
+from festy_crew.enrichment_crew.crew import enrichment_crew
+from festy_crew.enrichment_crew.fast_path import fast_enrich
+from festy_crew.models.festival import EnrichedContact, IndividualContact
+from festy_crew.store import MEMORY_STORE, configure_festival_store, get_festival_store
+from festy_crew.tools.clients import close_clients
+from festy_crew.tools.domain_health import get_domain_health
+from festy_crew.tools.hunter_cache import configure_hunter_cache
+from festy_crew.tools.scrape_cache import configure_scrape_cache
+from festy_crew.tools.scrape_executor import get_scrape_executor
+from festy_crew.tools.timeouts import budget_cut_short, budget_exhausted, festival_budget, mark_cut_short
+from festy_crew.utils.csv_handler import ENRICH_COLUMNS, enriched_to_csv, load_approved_festivals
+from festy_crew.utils.enriched_stream import EnrichedStreamWriter, load_enriched_stream
+from festy_crew.utils.metrics import (
+    enable_metrics,
+    metrics_scope,
+    record_tokens,
+    summary_lines,
+    timed,
+    write_metrics,
+)
+from festy_crew.utils.replay import configure_cassette
+
+
+BANNER = """
+╔══════════════════════════════════════════════════════════════╗
+║          festy-crew — Phase 2: Contact Enrichment            ║
+║        Finding organizer emails for approved festivals       ║
+╚══════════════════════════════════════════════════════════════╝
+"""
+
+DISCLAIMER = """
+IMPORTANT: This tool is for legitimate music industry outreach only.
+When contacting festival organizers, comply with all applicable privacy
+laws including GDPR, CAN-SPAM Act, and local regulations. Always:
+  - Include a clear unsubscribe option in your emails
+  - Identify yourself and your organization honestly
+  - Respect opt-out requests immediately
+  - Only contact people with a legitimate business reason
+"""
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Enrich approved festivals with organizer contact information"
+    )
+    add_enrich_arguments(parser)
+    return parser.parse_args(argv)
+
+
+_print_lock = threading.Lock()
+tier_counts: Counter = Counter()  # festivals resolved per tier: fast / crew / skipped / failed / stopped
+STOPPED_EARLY = "Stopped early: festival time budget used up"
+
+
+def _finished(contact: EnrichedContact) -> bool:
+    """False for failed or budget-cut results, which are retried on the next run."""
+    return not contact.notes.startswith(("Enrichment failed", STOPPED_EARLY))
+
+
+def _log(lines: List[str]) -> None:
+    """Print a block of lines without interleaving with other workers."""
+    with _print_lock:
+        print("\n".join(lines), flush=True)
+
+
+def _count_tier(tier: str) -> None:
+    with _print_lock:
+        tier_counts[tier] += 1
+
+
+def enrich_festival(
+    festival: dict, index: int, total: int, verbose: bool = True, fast_path: bool = True
+) -> EnrichedContact:
+    """Enrich a single festival. Never raises.
+
+    With ``fast_path`` the contact pages and Hunter are queried directly first;
+    the LLM crew only runs when that result would be "Low" confidence. If the
+    festival's time budget cut any request or tool call short, the result is
+    partial and its notes start with STOPPED_EARLY; a result that completed is
+    kept as-is however little budget was left.
+    """
+    name = festival.get("name", f"Festival {index}")
+    website = festival.get("website", "")
+
+    lines = [
+        f"\nProcessing festival {index}/{total}: {name}",
+        f"  Website: {website}",
+        "-" * 40,
+    ]
+
+    if not website:
+        lines.append(f"  Warning: No website for {name}, skipping enrichment.")
+        _log(lines)
+        _count_tier("skipped")
+        return EnrichedContact(
+            festival_name=name,
+            notes="No website available for contact lookup",
+        )
+
+    inputs = {
+        "festival_name": name,
+        "website": website,
+        "country": festival.get("country", ""),
+        "location": festival.get("location", ""),
+    }
+
+    if verbose:
+        # Serial mode: show the header before the crew's own verbose output
+        _log(lines)
+        lines = []
+
+    contact = partial = None
+    if fast_path:
+        try:
+            with timed("stage.fast_path"):
+                contact = fast_enrich(name, website)
+            if contact.confidence == "Low":
+                contact, partial = None, contact
+        except Exception as e:
+            lines.append(f"  Fast path failed ({e}); falling back to crew.")
+
+    try:
+        tier = "fast"
+        if contact is None and budget_exhausted():
+            # No time left for the crew: keep what the fast path found
+            mark_cut_short()
+            contact = partial or EnrichedContact(festival_name=name)
+        elif contact is None:
+            tier = "crew"
+            crew = enrichment_crew(verbose)
+            with timed("crew.enrichment"):
+                crew_result = crew.kickoff(inputs=inputs)
+            record_tokens("crew.enrichment", getattr(crew_result, "token_usage", None))
+
+            if hasattr(crew_result, "pydantic") and isinstance(crew_result.pydantic, EnrichedContact):
+                contact = crew_result.pydantic
+            else:
+                contact = EnrichedContact(
+                    festival_name=name,
+                    notes=f"Could not parse structured output. Raw: {str(crew_result.raw)[:200]}",
+                )
+        if budget_cut_short():
+            tier = "stopped"
+            contact.notes = f"{STOPPED_EARLY}. {contact.notes}".strip()
+        _count_tier(tier)
+        n = len(contact.contacts)
+        if not verbose:
+            lines[0] = f"\nFinished festival {index}/{total}: {name}"
+        resolved_by = {"fast": "fast path", "crew": "crew", "stopped": "out of time"}[tier]
+        lines.append(f"  Confidence: {contact.confidence} | Contacts found: {n} | Resolved by: {resolved_by}")
+        for person in contact.contacts:
+            role_str = f" ({person.role})" if person.role else ""
+            lines.append(f"    - {person.name or 'Unknown'}{role_str}: {person.email or 'no email'}")
+
+    except Exception as e:
+        _count_tier("failed")
+        lines.append(f"  Error enriching {name}: {e}")
+        contact = EnrichedContact(
+            festival_name=name,
+            notes=f"Enrichment failed: {str(e)[:200]}",
+        )
+
+    _log(lines)
+    return contact
+
+
+def _enrich_measured(festival: dict, *args, budget: Optional[float] = None) -> EnrichedContact:
+    """enrich_festival within its time budget, with its metrics attributed to the festival."""
+    with metrics_scope(festival.get("name") or festival.get("festival_key", "")):
+        with timed("festival"), festival_budget(budget):
+            return enrich_festival(festival, *args)
+
+
+def enrich_all(
+    approved: List[dict],
+    concurrency: int = 1,
+    on_result: Optional[Callable[[int, EnrichedContact], None]] = None,
+    fast_path: bool = True,
+    budget: Optional[float] = None,
+) -> List[EnrichedContact]:
+    """Enrich every approved festival, returning results in input order.
+
+    With concurrency > 1 festivals run on a bounded thread pool and the crews'
+    verbose output is suppressed so progress lines stay readable. ``on_result``
+    is called with (index, contact) as soon as each festival finishes.
+    ``budget`` is each festival's time budget in seconds (None = unlimited).
+    """
+    total = len(approved)
+    results: List[Optional[EnrichedContact]] = [None] * total
+
+    if concurrency <= 1:
+        for i, festival in enumerate(approved):
+            results[i] = _enrich_measured(festival, i + 1, total, True, fast_path, budget=budget)
+            if on_result:
+                on_result(i, results[i])
+        return results
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {
+            pool.submit(_enrich_measured, festival, i, total, False, fast_path, budget=budget): i - 1
+            for i, festival in enumerate(approved, 1)
+        }
+        for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+            index = futures[future]
+            results[index] = future.result()
+            if on_result:
+                on_result(index, results[index])
+            _log([f"  [{done}/{total} complete]"])
+    return results
+
+
+def main(args: Optional[argparse.Namespace] = None):
+    print(BANNER)
+    if args is None:
+        args = parse_args()
+    atexit.register(close_clients)
+    try:
+        configure_cassette(record=args.record, replay=args.replay)
+    except (ValueError, FileNotFoundError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if args.record or args.replay:
+        # Recordings must cover every festival, and replays must not touch real results
+        configure_festival_store(MEMORY_STORE)
+        print("Record/replay run: using a temporary festival store.")
+    enable_metrics(bool(args.metrics))
+    cache = configure_scrape_cache(enabled=not args.no_cache, refresh=args.refresh)
+    hunter_cache = configure_hunter_cache(enabled=not args.no_cache, refresh=args.refresh)
+
+    csv_path = args.csv_path
+    output_path = args.output
+
+    store = get_festival_store()
+    if Path(csv_path).exists():
+        print(f"Loading approved festivals from: {csv_path}\n")
+        approved = load_approved_festivals(csv_path, columns=ENRICH_COLUMNS)
+        store.import_approved(approved)
+        original = csv_path
+    else:
+        print(f"{csv_path} not found; loading approved festivals from the store {store.path}\n")
+        approved = store.approved_festivals()
+        original = pd.DataFrame(approved)
+
+    if not approved:
+        print("No approved festivals found. Please add 'Yes' in the 'Approved' column.")
+        sys.exit(0)
+
+    total = len(approved)
+    keys = [festival["festival_key"] for festival in approved]
+    stale = {festival["festival_key"] for festival in store.pending_enrichment(args.max_age * 86400)}
+    completed = store.enrichments([key for key in keys if key not in stale])
+    stored = len(completed)
+    progress_path = args.progress or f"{output_path}.progress.jsonl"
+    if args.resume:
+        streamed = load_enriched_stream(progress_path)
+        completed.update((key, contact) for key, contact in streamed.items() if _finished(contact))
+    pending = [festival for festival in approved if festival["festival_key"] not in completed]
+
+    print(f"Found {total} approved festivals to enrich.")
+    if stored:
+        print(f"{stored} enriched within the last {args.max_age:g} days in {store.path}, skipping.")
+    if len(completed) > stored:
+        print(f"Resuming: {len(completed) - stored} more already enriched in {progress_path}, skipping.")
+    concurrency = max(1, min(args.concurrency, len(pending) or 1))
+    if concurrency > 1:
+        print(f"Enriching {concurrency} festivals at a time.")
+    print(f"Streaming results to: {progress_path}")
+    print("\n" + "=" * 64)
+
+    with EnrichedStreamWriter(progress_path, append=args.resume) as writer:
+        def on_result(i: int, contact: EnrichedContact) -> None:
+            key = pending[i]["festival_key"]
+            writer.write(key, contact)
+            if _finished(contact):
+                store.save_enrichment(key, contact)  # failures and partial results stay pending
+
+        fresh = enrich_all(
+            pending,
+            concurrency,
+            on_result=on_result,
+            fast_path=not args.no_fast_path,
+            budget=args.festival_budget or None,
+        )
+    completed.update(zip((f["festival_key"] for f in pending), fresh))
+    results = [completed[key] for key in keys]
+
+    print("\n" + "=" * 64)
+    print(f"Enrichment complete. Saving results to {output_path}...")
+
+    enriched_to_csv(results, original, output_path, festival_keys=keys, parquet=args.parquet)
+
+    high = sum(1 for r in results if r.confidence == "High")
+    medium = sum(1 for r in results if r.confidence == "Medium")
+    low = sum(1 for r in results if r.confidence == "Low")
+    total_contacts = sum(len(r.contacts) for r in results)
+
+    print(f"\n{'=' * 64}")
+    print(f"Results saved to: {output_path}")
+    print(f"Total festivals processed: {total}")
+    print(f"Total individual contacts found: {total_contacts}")
+    print(f"  High confidence:   {high} festivals")
+    print(f"  Medium confidence: {medium} festivals")
+    print(f"  Low / not found:   {low} festivals")
+    print(
+        f"Resolved by fast path: {tier_counts['fast']} | by crew: {tier_counts['crew']} | "
+        f"skipped: {tier_counts['skipped']} | failed: {tier_counts['failed']} | "
+        f"stopped early (out of time): {tier_counts['stopped']}"
+    )
+    if cache.enabled:
+        print(f"Scrape cache: {cache.hits} hits, {cache.misses} misses")
+        print(
+            f"Hunter cache: {hunter_cache.hits} hits, {hunter_cache.misses} misses, "
+            f"{hunter_cache.collapsed} collapsed"
+        )
+    scrapes = get_scrape_executor().stats()
+    health = get_domain_health()
+    print(
+        f"Scrapes: {scrapes['completed']} completed, {scrapes['timed_out']} timed out, "
+        f"{scrapes['rejected']} rejected, {health.short_circuited} skipped (failing URL or domain)"
+    )
+    for domain, reason in health.open_domains().items():
+        print(f"  Circuit open for {domain}: {reason}")
+    if args.metrics:
+        write_metrics(args.metrics)
+        print(f"\nSlowest stages (full report in {args.metrics}):")
+        print("\n".join(summary_lines()))
+
+    print(f"\n{DISCLAIMER}")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
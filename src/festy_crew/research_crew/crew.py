@@ -1,8 +1,14 @@
+from typing import Optional
+
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
+from crewai.tasks.task_output import TaskOutput
 
 from festy_crew.models.festival import FestivalList
 from festy_crew.tools.firecrawl_tool import FirecrawlScrapeTool, FirecrawlSearchTool
+from festy_crew.tools.instrumented import instrument_tools
+from festy_crew.utils.checkpoint import RunCheckpoint
+from festy_crew.utils.replay import crew_llm, wrap_tools
 
 
 @CrewBase
@@ -12,11 +18,16 @@ class ResearchCrew:
     agents_config = "config/agents.yaml"
     tasks_config = "config/tasks.yaml"
 
+    def __init__(self, checkpoint: Optional[RunCheckpoint] = None):
+        # When set, each task's output is persisted as soon as it finishes
+        self.checkpoint = checkpoint
+
     @agent
     def festival_researcher(self) -> Agent:
         return Agent(
             config=self.agents_config["festival_researcher"],
-            tools=[FirecrawlSearchTool(), FirecrawlScrapeTool()],
+            tools=instrument_tools(wrap_tools([FirecrawlSearchTool(), FirecrawlScrapeTool()])),
+            llm=crew_llm(),
             verbose=True,
         )
 
@@ -24,6 +35,7 @@ class ResearchCrew:
     def genre_filter_analyst(self) -> Agent:
         return Agent(
             config=self.agents_config["genre_filter_analyst"],
+            llm=crew_llm(),
             verbose=True,
         )
 
@@ -47,4 +59,22 @@ class ResearchCrew:
             tasks=self.tasks,
             process=Process.sequential,
             verbose=True,
+            task_callback=self.checkpoint.save_task_output if self.checkpoint else None,
+        )
+
+    def scoring_crew(self, discovery_raw: str) -> Crew:
+        """Crew that only re-runs scoring, reusing a saved discovery output as context."""
+        discover = self.discover_festivals_task()
+        discover.output = TaskOutput(
+            name="discover_festivals_task",
+            description=discover.description,
+            raw=discovery_raw,
+            agent=self.festival_researcher().role,
+        )
+        return Crew(
+            agents=[self.genre_filter_analyst()],
+            tasks=[self.score_and_filter_festivals_task()],
+            process=Process.sequential,
+            verbose=True,
+            task_callback=self.checkpoint.save_task_output if self.checkpoint else None,
         )
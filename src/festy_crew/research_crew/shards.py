@@ -0,0 +1,123 @@
+from typing import Dict, List
+
+# Countries in discovery order, with the short form used in search queries
+COUNTRIES: Dict[str, str] = {
+    "Japan": "Japan",
+    "South Korea": "Korea",
+    "Thailand": "Thailand",
+    "Philippines": "Philippines",
+    "Taiwan": "Taiwan",
+    "Indonesia": "Indonesia",
+    "Singapore": "Singapore",
+    "India": "India",
+    "Vietnam": "Vietnam",
+    "Malaysia": "Malaysia",
+    "Hong Kong": "Hong Kong",
+    "China": "China",
+}
+
+# Curated list pages covering a single country
+COUNTRY_PAGES: Dict[str, List[str]] = {
+    "Japan": [
+        "https://www.musicfestivalwizard.com/festival-guide/japan/",
+        "https://en.wikipedia.org/wiki/List_of_music_festivals_in_Japan",
+    ],
+    "South Korea": [
+        "https://www.musicfestivalwizard.com/festival-guide/south-korea/",
+        "https://en.wikipedia.org/wiki/List_of_music_festivals_in_South_Korea",
+        "https://koreatodo.com/top-festivals-seoul-korea",
+    ],
+    "Thailand": ["https://www.musicfestivalwizard.com/festival-guide/thailand/"],
+    "Philippines": ["https://www.musicfestivalwizard.com/festival-guide/philippines/"],
+    "India": [
+        "https://www.musicfestivalwizard.com/festival-guide/india/",
+        "https://en.wikipedia.org/wiki/List_of_music_festivals_in_India",
+    ],
+    "Singapore": [
+        "https://www.musicfestivalwizard.com/festival-guide/singapore/",
+        "https://en.wikipedia.org/wiki/List_of_music_festivals_in_Singapore",
+        "https://www.timeout.com/singapore/music/best-music-festivals-in-singapore",
+    ],
+    "Malaysia": ["https://www.musicfestivalwizard.com/festival-guide/malaysia/"],
+    "Hong Kong": ["https://www.timeout.com/hong-kong/music/best-music-festivals-in-hong-kong"],
+}
+
+# Curated list pages covering Asia as a whole
+GENERAL_PAGES: List[str] = [
+    "https://ocultmag.com/2026/01/11/the-asian-music-festivals-that-matter-in-2026/",
+    "https://www.sassyhongkong.com/travel-short-haul-music-festivals-in-asia-rave-party/",
+    "https://thesmartlocal.com/read/music-festivals-asia/",
+    "https://thebeat.asia/the-list/whats-on/music-festivals-in-asia-2025",
+    "https://www.timeout.com/asia/music/best-music-festivals-in-asia",
+    "https://www.musicfestivalwizard.com/festival-guide/asia-festivals/",
+    "https://www.bandwagon.asia",
+]
+
+FULL_CANDIDATE_TARGET = "60-120"  # discovery candidates across all of Asia
+FULL_SCORE_TARGET = "30-60"  # festivals kept by scoring across all of Asia
+
+
+def search_queries(countries: List[str]) -> str:
+    """Numbered Firecrawl search list for ``countries``, three queries each."""
+    queries = []
+    for country in countries:
+        short = COUNTRIES[country]
+        queries += [
+            f'"music festivals {country} 2025 2026"',
+            f'"indie alternative music festivals {short}"',
+            f'"boutique independent music festival {short}"',
+        ]
+    return "\n".join(f"{i}. {q}" for i, q in enumerate(queries, 1))
+
+
+def resource_pages(countries: List[str], general_pages: List[str]) -> str:
+    pages = list(general_pages)
+    for country in countries:
+        pages += COUNTRY_PAGES.get(country, [])
+    return "\n".join(f"- {url}" for url in pages)
+
+
+def discovery_inputs(
+    countries: List[str],
+    general_pages: List[str],
+    base_inputs: dict,
+    candidate_target: str = FULL_CANDIDATE_TARGET,
+    score_target: str = FULL_SCORE_TARGET,
+) -> dict:
+    """Crew inputs restricting discovery to ``countries`` and the given list pages."""
+    return {
+        **base_inputs,
+        "regions": f"Asia ({', '.join(countries)})",
+        "search_queries": search_queries(countries),
+        "resource_pages": resource_pages(countries, general_pages),
+        "candidate_target": candidate_target,
+        "score_target": score_target,
+    }
+
+
+def _shard_target(full_target: str, num_shards: int, floor: int) -> str:
+    """A "low-high" target's share for one of ``num_shards`` shards, at least floor-2*floor."""
+    low, high = (int(x) for x in full_target.split("-"))
+    return f"{max(floor, low // num_shards)}-{max(2 * floor, high // num_shards)}"
+
+
+def plan_shards(num_shards: int, base_inputs: dict) -> List[dict]:
+    """Split discovery into ``num_shards`` country groups.
+
+    Countries and the Asia-wide list pages are dealt round-robin so shards stay
+    roughly balanced; the candidate and scoring targets are scaled down per shard.
+    """
+    countries = list(COUNTRIES)
+    num_shards = max(1, min(num_shards, len(countries)))
+    candidate_target = _shard_target(FULL_CANDIDATE_TARGET, num_shards, floor=5)
+    score_target = _shard_target(FULL_SCORE_TARGET, num_shards, floor=3)
+    return [
+        discovery_inputs(
+            countries[i::num_shards],
+            GENERAL_PAGES[i::num_shards],
+            base_inputs,
+            candidate_target,
+            score_target,
+        )
+        for i in range(num_shards)
+    ]
@@ -0,0 +1,221 @@
+import csv
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from festy_crew.models.festival import EnrichedContact, Festival
+from festy_crew.utils.festival_key import festival_key, normalize_domain
+
+
+DEFAULT_STORE_PATH = "festivals.sqlite"
+MEMORY_STORE = ":memory:"  # a throwaway store for record/replay runs
+FESTIVAL_COLUMNS = list(Festival.model_fields)
+
+
+def _text(value) -> str:
+    """A field as text; None and pandas' NaN (which isn't equal to itself) become ""."""
+    return "" if value is None or value != value else str(value)
+
+
+class FestivalStore:
+    """SQLite store of every festival seen across runs, with approvals and enrichments.
+
+    Festivals are keyed by festival_key. Phase 1 upserts candidates here, and
+    a re-discovered festival fills in blank fields but keeps its approval and
+    contacts. Phase 2 asks for approved festivals whose enrichment is missing
+    or older than a cutoff, so re-runs only do new work. CSV stays the
+    review/export format: ``export_csv`` writes the phase 1 layout and
+    ``import_csv`` reads approvals back.
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            fields = "".join(f" {column} TEXT NOT NULL DEFAULT ''," for column in FESTIVAL_COLUMNS)
+            self._conn.executescript(
+                "CREATE TABLE IF NOT EXISTS festivals ("
+                " festival_key TEXT PRIMARY KEY,"
+                f"{fields}"
+                " domain TEXT NOT NULL DEFAULT '',"
+                " approved INTEGER NOT NULL DEFAULT 0,"
+                " first_seen REAL NOT NULL,"
+                " last_seen REAL NOT NULL,"
+                " enriched_at REAL,"
+                " enrichment TEXT);"
+                "CREATE INDEX IF NOT EXISTS idx_festivals_domain ON festivals (domain);"
+                "CREATE INDEX IF NOT EXISTS idx_festivals_country ON festivals (country);"
+                "CREATE INDEX IF NOT EXISTS idx_festivals_approved"
+                " ON festivals (approved, enriched_at);"
+                "CREATE INDEX IF NOT EXISTS idx_festivals_enriched_at ON festivals (enriched_at);"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _upsert(self, records: Iterable[Tuple[dict, Optional[bool]]]) -> Tuple[int, int]:
+        """Insert or merge (festival fields, approval) pairs; None leaves approval as is."""
+        now = time.time()
+        updates = ", ".join(
+            f"{c} = CASE WHEN excluded.{c} != '' THEN excluded.{c} ELSE festivals.{c} END"
+            for c in FESTIVAL_COLUMNS + ["domain"]
+        )
+        sql = (
+            f"INSERT INTO festivals (festival_key, {', '.join(FESTIVAL_COLUMNS)}, domain,"
+            " approved, first_seen, last_seen)"
+            f" VALUES (:festival_key, {', '.join(':' + c for c in FESTIVAL_COLUMNS)}, :domain,"
+            " COALESCE(:approved, 0), :now, :now)"
+            f" ON CONFLICT (festival_key) DO UPDATE SET {updates},"
+            " approved = COALESCE(:approved, festivals.approved), last_seen = :now"
+        )
+        new = updated = 0
+        with self._lock:
+            conn = self._connect()
+            for fields, approved in records:
+                params = {c: _text(fields.get(c)) for c in FESTIVAL_COLUMNS}
+                params["festival_key"] = fields.get("festival_key") or festival_key(
+                    params["name"], params["website"]
+                )
+                params["domain"] = normalize_domain(params["website"])
+                params["approved"] = None if approved is None else int(approved)
+                params["now"] = now
+                exists = conn.execute(
+                    "SELECT 1 FROM festivals WHERE festival_key = ?", (params["festival_key"],)
+                ).fetchone()
+                conn.execute(sql, params)
+                if exists:
+                    updated += 1
+                else:
+                    new += 1
+            conn.commit()
+        return new, updated
+
+    def upsert_festivals(self, festivals: List[Festival]) -> Tuple[int, int]:
+        """Add or refresh discovered festivals; returns (new, updated) counts."""
+        return self._upsert((f.model_dump(), None) for f in festivals)
+
+    def import_csv(self, csv_path: str) -> Tuple[int, int]:
+        """Upsert the festivals in a phase 1 CSV (or Parquet file), taking approvals from its Approved column."""
+        if csv_path.lower().endswith(".parquet"):
+            import pyarrow.parquet as pq
+
+            rows = pq.read_table(csv_path).to_pylist()
+        else:
+            with open(csv_path, newline="", encoding="utf-8") as f:
+                rows = list(csv.DictReader(line for line in f if not line.startswith("#")))
+        has_approved = bool(rows) and "Approved" in rows[0]
+        return self._upsert(
+            (row, (row.get("Approved") or "").strip().lower() == "yes" if has_approved else None)
+            for row in rows
+            if row.get("name")
+        )
+
+    def import_approved(self, rows: List[dict]) -> Tuple[int, int]:
+        """Upsert festivals already loaded from an approved-only read and mark them approved.
+
+        Unlike ``import_csv`` this never re-reads the file, and it leaves
+        approvals withdrawn in the file as they are in the store.
+        """
+        return self._upsert((row, True) for row in rows if _text(row.get("name")))
+
+    def export_csv(self, csv_path: str, approved_only: bool = False) -> int:
+        """Write festivals in the phase 1 CSV layout, with approvals in the Approved column."""
+        rows = self._festivals("WHERE approved = 1" if approved_only else "", ())
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=FESTIVAL_COLUMNS + ["festival_key", "Approved"])
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(
+                    {**{c: row[c] for c in FESTIVAL_COLUMNS + ["festival_key"]},
+                     "Approved": "Yes" if row["approved"] else ""}
+                )
+        return len(rows)
+
+    def _festivals(self, where: str, params: tuple) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._connect().execute(
+                f"SELECT * FROM festivals {where} ORDER BY first_seen, rowid", params
+            ).fetchall()
+
+    @staticmethod
+    def _as_dict(row: sqlite3.Row) -> dict:
+        return {c: row[c] for c in FESTIVAL_COLUMNS + ["festival_key"]}
+
+    def approved_festivals(self) -> List[dict]:
+        return [self._as_dict(row) for row in self._festivals("WHERE approved = 1", ())]
+
+    def approved_keys(self) -> set:
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT festival_key FROM festivals WHERE approved = 1"
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def pending_enrichment(self, max_age_seconds: float) -> List[dict]:
+        """Approved festivals never enriched, or enriched longer than ``max_age_seconds`` ago."""
+        rows = self._festivals(
+            "WHERE approved = 1 AND (enriched_at IS NULL OR enriched_at < ?)",
+            (time.time() - max_age_seconds,),
+        )
+        return [self._as_dict(row) for row in rows]
+
+    def enrichments(self, keys: List[str]) -> Dict[str, EnrichedContact]:
+        """Stored enrichment results for ``keys`` (those that have one)."""
+        found: Dict[str, EnrichedContact] = {}
+        with self._lock:
+            conn = self._connect()
+            for key in keys:
+                row = conn.execute(
+                    "SELECT enrichment FROM festivals WHERE festival_key = ? AND enrichment IS NOT NULL",
+                    (key,),
+                ).fetchone()
+                if row:
+                    found[key] = EnrichedContact(**json.loads(row[0]))
+        return found
+
+    def save_enrichment(self, key: str, contact: EnrichedContact) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "UPDATE festivals SET enrichment = ?, enriched_at = ? WHERE festival_key = ?",
+                (contact.model_dump_json(), time.time(), key),
+            )
+            conn.commit()
+
+    def counts(self) -> dict:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(approved), 0),"
+                " COALESCE(SUM(approved = 1 AND enriched_at IS NOT NULL), 0) FROM festivals"
+            ).fetchone()
+        return {"festivals": row[0], "approved": row[1], "enriched": row[2]}
+
+
+_store: Optional[FestivalStore] = None
+_store_lock = threading.Lock()
+
+
+def get_festival_store() -> FestivalStore:
+    """Return the process-wide festival store; FESTY_STORE_PATH overrides its location."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = FestivalStore(os.getenv("FESTY_STORE_PATH", DEFAULT_STORE_PATH))
+        return _store
+
+
+def configure_festival_store(path: str) -> FestivalStore:
+    """Point the process-wide store at ``path`` (e.g. MEMORY_STORE) for the rest of the run."""
+    global _store
+    with _store_lock:
+        _store = FestivalStore(path)
+        return _store
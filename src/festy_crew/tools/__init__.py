@@ -3,7 +3,11 @@ from festy_crew.tools.firecrawl_tool import (
     FirecrawlSearchTool,
     WebsiteContactFinderTool,
 )
-from festy_crew.tools.hunter_tool import HunterDomainSearchTool, HunterEmailVerifierTool
+from festy_crew.tools.hunter_tool import (
+    HunterBatchEmailVerifierTool,
+    HunterDomainSearchTool,
+    HunterEmailVerifierTool,
+)
 
 __all__ = [
     "FirecrawlScrapeTool",
@@ -11,4 +15,5 @@ __all__ = [
     "WebsiteContactFinderTool",
     "HunterDomainSearchTool",
     "HunterEmailVerifierTool",
+    "HunterBatchEmailVerifierTool",
 ]
@@ -0,0 +1,215 @@
+import asyncio
+import contextvars
+import os
+import threading
+import weakref
+from typing import Dict, Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_POOL_SIZE = 16
+
+_lock = threading.Lock()
+_sessions: Dict[str, requests.Session] = {}
+_firecrawl_client = None
+# Async clients hold connections bound to one event loop, so they are kept per loop
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, object]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _pool_size() -> int:
+    return int(os.getenv("FESTY_HTTP_POOL_SIZE", DEFAULT_POOL_SIZE))
+
+
+def get_http_session(api: str) -> requests.Session:
+    """Return the shared keep-alive session for ``api`` (e.g. "hunter").
+
+    One session per API keeps connections to that host warm across tool calls.
+    The adapter's pool is sized by FESTY_HTTP_POOL_SIZE so concurrent tools can
+    each hold a connection without discarding others.
+    """
+    with _lock:
+        session = _sessions.get(api)
+        if session is None:
+            size = _pool_size()
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["Connection"] = "keep-alive"
+            _sessions[api] = session
+        return session
+
+
+# The session a pooled Firecrawl HttpClient is sending through, while it is in a call
+_firecrawl_session: "contextvars.ContextVar[Optional[requests.Session]]" = contextvars.ContextVar(
+    "festy_firecrawl_session", default=None
+)
+_FIRECRAWL_METHODS = ("post", "post_multipart", "get", "delete", "patch")
+
+
+class _SessionRouter:
+    """Stands in for ``requests`` inside firecrawl-py's http_client module.
+
+    Request functions go through the session of the pooled client making the
+    call, and behave exactly like ``requests`` for every other caller.
+    """
+
+    _METHODS = ("request", "get", "post", "put", "patch", "delete", "head")
+
+    def __getattr__(self, name: str):
+        session = _firecrawl_session.get()
+        if session is not None and name in self._METHODS:
+            return getattr(session, name)
+        return getattr(requests, name)  # exceptions, Response, unpooled callers
+
+
+def _pooled_http_client_class(base: type) -> type:
+    """A subclass of firecrawl-py's HttpClient whose calls use its ``_festy_session``."""
+
+    def wrap(name: str):
+        method = getattr(base, name)
+
+        def pooled(self, *args, **kwargs):
+            token = _firecrawl_session.set(self._festy_session)
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                _firecrawl_session.reset(token)
+
+        pooled.__name__ = name
+        return pooled
+
+    methods = {name: wrap(name) for name in _FIRECRAWL_METHODS if hasattr(base, name)}
+    return type(f"Pooled{base.__name__}", (base,), methods)
+
+
+def _pool_firecrawl(app, session: requests.Session) -> bool:
+    """Route one Firecrawl client's sync HTTP calls through ``session``.
+
+    firecrawl-py has no hook for a session: its v2 HttpClient calls
+    ``requests.post``/``requests.get`` directly, opening a new connection per
+    call. This client's HttpClient is switched to a subclass that sends those
+    calls through ``session``; other Firecrawl clients in the process are not
+    affected. If the SDK's layout is not the one expected, pooling is skipped
+    with a warning and the client works unpooled. Returns whether it was pooled.
+    """
+    try:
+        from firecrawl.v2.utils import http_client as module
+    except ImportError:
+        module = None
+    http = getattr(getattr(app, "_v2_client", None), "http_client", None)
+    base = getattr(module, "HttpClient", None)
+    router = getattr(module, "requests", None)
+    if (
+        base is None
+        or type(http) is not base
+        or not (router is requests or isinstance(router, _SessionRouter))
+        or not any(hasattr(base, name) for name in _FIRECRAWL_METHODS)
+    ):
+        print("Warning: unrecognised firecrawl-py internals; Firecrawl requests are not pooled.")
+        return False
+    if router is requests:
+        module.requests = _SessionRouter()
+    http.__class__ = _pooled_http_client_class(base)
+    http._festy_session = session
+    return True
+
+
+def get_firecrawl_client():
+    """Return the process-wide Firecrawl client, creating it on first use.
+
+    Its requests go through the shared "firecrawl" session (see _pool_firecrawl).
+    """
+    global _firecrawl_client
+    with _lock:
+        if _firecrawl_client is not None:
+            return _firecrawl_client
+    session = get_http_session("firecrawl")
+    with _lock:
+        if _firecrawl_client is None:
+            from firecrawl import FirecrawlApp
+            api_key = os.getenv("FIRECRAWL_API_KEY")
+            if not api_key:
+                raise ValueError("FIRECRAWL_API_KEY environment variable is not set")
+            client = FirecrawlApp(api_key=api_key)
+            _pool_firecrawl(client, session)
+            _firecrawl_client = client
+        return _firecrawl_client
+
+
+def _loop_clients() -> Dict[str, object]:
+    loop = asyncio.get_running_loop()
+    with _lock:
+        return _async_clients.setdefault(loop, {})
+
+
+def get_async_http_client(api: str) -> httpx.AsyncClient:
+    """Return the pooled async client for ``api`` on the running event loop.
+
+    The async counterpart of get_http_session: one keep-alive pool per API,
+    sized by FESTY_HTTP_POOL_SIZE, so thousands of lookups share a handful of
+    connections instead of each needing a thread.
+    """
+    clients = _loop_clients()
+    client = clients.get(f"http:{api}")
+    if client is None:
+        size = _pool_size()
+        client = clients[f"http:{api}"] = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=size, max_keepalive_connections=size)
+        )
+    return client
+
+
+def get_async_firecrawl_client():
+    """Return the AsyncFirecrawl client for the running event loop."""
+    clients = _loop_clients()
+    client = clients.get("firecrawl")
+    if client is None:
+        from firecrawl import AsyncFirecrawl
+        api_key = os.getenv("FIRECRAWL_API_KEY")
+        if not api_key:
+            raise ValueError("FIRECRAWL_API_KEY environment variable is not set")
+        client = clients["firecrawl"] = AsyncFirecrawl(api_key=api_key)
+    return client
+
+
+async def _aclose(clients: Dict[str, object]) -> None:
+    for name, client in clients.items():
+        # AsyncFirecrawl keeps no idle connections and has no close() of its own
+        if name.startswith("http:"):
+            await client.aclose()
+
+
+async def aclose_clients() -> None:
+    """Close the async clients created on the running event loop.
+
+    Code that runs its own event loop should await this before the loop ends.
+    """
+    with _lock:
+        clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    await _aclose(clients)
+
+
+def close_clients() -> None:
+    """Close pooled sessions, drop the shared Firecrawl client and close leftover async clients.
+
+    Registered at exit by both phases. Async clients can only be closed on
+    their own loop: those whose loop is still open and idle are closed on it;
+    the rest went away with their loop.
+    """
+    global _firecrawl_client
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _firecrawl_client = None
+        leftovers = list(_async_clients.items())
+        _async_clients.clear()
+    for loop, clients in leftovers:
+        if clients and not (loop.is_closed() or loop.is_running()):
+            loop.run_until_complete(_aclose(clients))
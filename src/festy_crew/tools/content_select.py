@@ -0,0 +1,129 @@
+import re
+from typing import List
+
+CHARS_PER_TOKEN = 4  # rough size of an English token, used to turn budgets into characters
+MAX_BLOCK_CHARS = 800  # longer blocks are split on lines so one block can't eat the budget
+MIN_CONTEXT_CHARS = 300  # kept from the top of the page even when no block scores above zero
+GAP_MARKER = "[...]"
+
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+_PHONE_RE = re.compile(r"(?:\+|\btel:?\s*|\bphone:?\s*)?\(?\d[\d\s().-]{7,}\d", re.I)
+_ROLE_RE = re.compile(
+    r"\b(book(?:ing|er)?s?|press|media|contact|enquir\w*|inquir\w*|director|founder|organi[sz]\w*|"
+    r"team|staff|submi\w*|apply|application|artists?|partner\w*|sponsor\w*|promoter|curator|"
+    r"programm\w*|producer|manager)\b",
+    re.I,
+)
+_FESTIVAL_RE = re.compile(r"\b(festival|fest|line-?up|stage|tickets?|venue)\b", re.I)
+_DATE_RE = re.compile(
+    r"\b(20\d{2}|jan(uary)?|feb(ruary)?|mar(ch)?|apr(il)?|may|june?|july?|aug(ust)?|"
+    r"sep(t|tember)?|oct(ober)?|nov(ember)?|dec(ember)?)\b",
+    re.I,
+)
+_LINK_RE = re.compile(r"\[[^\]]*\]\([^)]*\)")
+
+
+def _split_line(line: str) -> List[str]:
+    """Cut a line longer than MAX_BLOCK_CHARS into pieces, at whitespace where possible."""
+    pieces = []
+    while len(line) > MAX_BLOCK_CHARS:
+        cut = line.rfind(" ", MAX_BLOCK_CHARS // 2, MAX_BLOCK_CHARS + 1)
+        if cut <= 0:
+            cut = MAX_BLOCK_CHARS
+        pieces.append(line[:cut])
+        line = line[cut:].lstrip()
+    if line:
+        pieces.append(line)
+    return pieces
+
+
+def split_blocks(markdown: str) -> List[str]:
+    """Split markdown into paragraph-like blocks, breaking up oversized ones on lines.
+
+    Single lines over MAX_BLOCK_CHARS (minified pages, one-line footers) are cut
+    into pieces rather than truncated, so nothing in them is lost.
+    """
+    blocks = []
+    for block in re.split(r"\n\s*\n", markdown):
+        block = block.strip()
+        if not block:
+            continue
+        if len(block) <= MAX_BLOCK_CHARS:
+            blocks.append(block)
+            continue
+        chunk: List[str] = []
+        size = 0
+        for line in block.splitlines():
+            for piece in _split_line(line):
+                if chunk and size + len(piece) > MAX_BLOCK_CHARS:
+                    blocks.append("\n".join(chunk))
+                    chunk, size = [], 0
+                chunk.append(piece)
+                size += len(piece) + 1
+        if chunk:
+            blocks.append("\n".join(chunk))
+    return blocks
+
+
+def score_block(block: str) -> float:
+    """Relevance of a block to contact research; navigation and link lists score low."""
+    emails = len(set(m.lower() for m in _EMAIL_RE.findall(block)))
+    roles = len(set(m.lower() for m in _ROLE_RE.findall(block)))
+    score = 6.0 * min(emails, 3)
+    score += 2.0 if _PHONE_RE.search(block) else 0.0
+    score += 1.5 * min(roles, 3)
+    score += 1.0 if _FESTIVAL_RE.search(block) else 0.0
+    score += 1.0 if _DATE_RE.search(block) else 0.0
+
+    # Link markup left after removing it says how much of the block is real text
+    text = _LINK_RE.sub("", block)
+    link_share = 1 - len(text.strip()) / max(len(block), 1)
+    return score - 3.0 * link_share
+
+
+def select_content(markdown: str, token_budget: int) -> str:
+    """Keep the relevant blocks of ``markdown``, at most ``token_budget`` tokens of them.
+
+    Pages already within budget are returned unchanged. Otherwise blocks that
+    score above zero are taken best-first (earlier blocks win ties); navigation,
+    link lists and other boilerplate are left out even when there is room, apart
+    from the first MIN_CONTEXT_CHARS of the page if too little was kept. Blocks
+    are emitted in page order, with a gap marker wherever blocks were left out.
+    """
+    budget = token_budget * CHARS_PER_TOKEN
+    if len(markdown) <= budget:
+        return markdown
+
+    blocks = split_blocks(markdown)
+    scores = [score_block(block) for block in blocks]
+    ranked = sorted(range(len(blocks)), key=lambda i: (-scores[i], i))
+    chosen = set()
+    used = 0
+
+    def take(i: int) -> None:
+        nonlocal used
+        cost = len(blocks[i]) + len(GAP_MARKER) + 4
+        if used + cost <= budget:
+            chosen.add(i)
+            used += cost
+
+    for i in ranked:
+        if scores[i] <= 0:
+            break
+        take(i)
+    for i in range(len(blocks)):
+        if used >= MIN_CONTEXT_CHARS:
+            break
+        if i not in chosen:
+            take(i)
+
+    parts: List[str] = []
+    previous = -1
+    for i in sorted(chosen):
+        if i != previous + 1:
+            parts.append(GAP_MARKER)
+        parts.append(blocks[i])
+        previous = i
+    if previous != len(blocks) - 1:
+        parts.append(GAP_MARKER)
+    return "\n\n".join(parts)
@@ -0,0 +1,188 @@
+import asyncio
+import re
+from typing import Iterable, List, Tuple
+from urllib.parse import unquote, urljoin, urlparse, urlunparse
+
+from festy_crew.tools.clients import get_async_http_client, get_http_session
+from festy_crew.tools.scrape_cache import get_scrape_cache
+from festy_crew.utils.festival_key import normalize_domain
+from festy_crew.utils.metrics import count, timed
+
+SITEMAP_TIMEOUT_SECONDS = 5
+MAX_CHILD_SITEMAPS = 3  # sitemap indexes: only the first few child sitemaps are read
+
+# (pattern, weight) matched against a link's decoded path and its anchor text.
+# English plus the languages of the festival markets: Japanese, Korean, Thai.
+CONTACT_KEYWORDS: List[Tuple[re.Pattern, float]] = [
+    (re.compile(r"contact|enquir|inquir|get.?in.?touch|toiawase", re.I), 5.0),
+    (re.compile(r"お問い?合わ?せ|問い?合わ?せ|連絡先|コンタクト", re.I), 5.0),
+    (re.compile(r"문의|연락처|컨택트", re.I), 5.0),
+    (re.compile(r"ติดต่อ", re.I), 5.0),
+    (re.compile(r"organi[sz]|staff|team|crew|people|booking|主催|運営|スタッフ|주최|운영|스태프|ผู้จัด|ทีมงาน", re.I), 3.5),
+    (re.compile(r"press|media|プレス|取材|보도|언론|สื่อ", re.I), 3.0),
+    (re.compile(r"about|company|会社概要|概要|について|소개|เกี่ยวกับ", re.I), 2.0),
+    (re.compile(r"submi|apply|artist|出演|応募|참가|지원|สมัคร", re.I), 1.5),
+    (re.compile(r"info|インフォ|안내|ข้อมูล", re.I), 1.0),
+]
+# Pages that look relevant by keyword but never hold organizer contacts
+_EXCLUDE_RE = re.compile(
+    r"ticket|shop|store|cart|login|sign.?in|privacy|terms|policy|cookie|faq|news|blog|archive|"
+    r"チケット|ニュース|티켓|뉴스|ตั๋ว|ข่าว",
+    re.I,
+)
+_SKIP_EXTENSIONS = (
+    ".pdf", ".jpg", ".jpeg", ".png", ".gif", ".svg", ".webp", ".zip", ".mp3", ".mp4", ".css", ".js", ".xml",
+)
+
+_MARKDOWN_LINK_RE = re.compile(r"\[([^\]]*)\]\(\s*<?([^)\s>]+)>?(?:\s+\"[^\"]*\")?\s*\)")
+_SITEMAP_LOC_RE = re.compile(r"<loc>\s*([^<\s]+)\s*</loc>", re.I)
+# Matched against a page's title and headings only: "404" alone is common in body text
+_SOFT_404_RE = re.compile(
+    r"^(?:error\s*)?404\b|\b404\W*(?:page\s+|file\s+)?not\s+found|page\s+not\s+found"
+    r"|(?:page|file)\s+(?:could\s+)?not\s+be\s+found"
+    r"|ページが見つかりません|페이지를 찾을 수 없|ไม่พบหน้า",
+    re.I,
+)
+_LANGUAGE_PREFIX_RE = re.compile(r"^/[a-z]{2}(?:[-_][a-z]{2,4})?(?=/|$)", re.I)
+
+
+def extract_links(markdown: str, base_url: str) -> List[Tuple[str, str]]:
+    """(absolute url, anchor text) for every markdown link in a scraped page."""
+    links = []
+    for text, href in _MARKDOWN_LINK_RE.findall(markdown or ""):
+        if href.startswith(("mailto:", "tel:", "javascript:", "#")):
+            continue
+        links.append((urljoin(f"{base_url}/", href), text))
+    return links
+
+
+def parse_sitemap(xml: str) -> Tuple[List[str], bool]:
+    """Page URLs in a sitemap, and whether it is a sitemap index of child sitemaps."""
+    return _SITEMAP_LOC_RE.findall(xml or ""), "<sitemapindex" in (xml or "")
+
+
+def is_soft_404(markdown: str) -> bool:
+    """True for "not found" pages served with a 200 status.
+
+    Only the first line and the markdown headings near the top are checked, so
+    a contact page that mentions "404" or "not found" in its text is kept.
+    """
+    lines = [line.strip() for line in (markdown or "")[:300].splitlines() if line.strip()]
+    titles = [line.lstrip("#").strip() for i, line in enumerate(lines) if i == 0 or line.startswith("#")]
+    return any(_SOFT_404_RE.search(title) for title in titles)
+
+
+def _canonical(url: str) -> str:
+    parsed = urlparse(url)
+    path = parsed.path.rstrip("/") or "/"
+    return urlunparse((parsed.scheme.lower(), parsed.netloc.lower(), path, "", parsed.query, ""))
+
+
+def score_url(url: str, text: str = "") -> float:
+    """How likely ``url`` is a contact/organizer page, from its path and link text."""
+    path = unquote(urlparse(url).path)
+    haystack = f"{path} {text}"
+    if _EXCLUDE_RE.search(haystack):
+        return 0.0
+    score = sum(weight for pattern, weight in CONTACT_KEYWORDS if pattern.search(haystack))
+    if score:
+        # Prefer shallow pages: /contact over /2019/artists/contact-form
+        score -= 1.0 * path.strip("/").count("/")
+    return max(score, 0.0)
+
+
+def rank_candidates(base_url: str, links: Iterable[Tuple[str, str]], limit: int) -> List[str]:
+    """The ``limit`` best same-site contact page candidates, best first.
+
+    Links to other sites, the homepage itself, files and pages with no contact
+    keyword are dropped. A URL seen several times keeps its best score, and
+    language variants of one page (/en/contact, /ja/contact) take a single slot.
+    """
+    domain = normalize_domain(base_url)
+    home = _canonical(base_url)
+    best = {}
+    for url, text in links:
+        parsed = urlparse(url)
+        host = normalize_domain(url)
+        if parsed.scheme not in ("http", "https") or not domain:
+            continue
+        if host != domain and not host.endswith(f".{domain}"):
+            continue
+        if parsed.path.lower().endswith(_SKIP_EXTENSIONS):
+            continue
+        canonical = _canonical(url)
+        if canonical == home:
+            continue
+        score = score_url(url, text)
+        if score > best.get(canonical, 0.0):
+            best[canonical] = score
+    ranked, variants = [], set()
+    for url in sorted(best, key=lambda url: (-best[url], len(url))):
+        variant = _LANGUAGE_PREFIX_RE.sub("", urlparse(url).path) or "/"
+        if variant not in variants:
+            variants.add(variant)
+            ranked.append(url)
+    return ranked[:limit]
+
+
+def _sitemap_text(url: str) -> str:
+    """Body of a sitemap, cached alongside scraped pages; empty if unavailable."""
+    cache = get_scrape_cache()
+    key = f"sitemap:{url}"
+    cached = cache.get(key)
+    if cached is not None:
+        count("sitemap.fetch", "cache_hits")
+        return cached
+    count("sitemap.fetch", "cache_misses")
+    with timed("sitemap.fetch") as timer:
+        response = get_http_session("sitemap").get(url, timeout=SITEMAP_TIMEOUT_SECONDS)
+        text = response.text if response.ok else ""
+        timer.bytes = len(text)
+    cache.set(key, text)
+    return text
+
+
+async def _sitemap_text_async(url: str) -> str:
+    cache = get_scrape_cache()
+    key = f"sitemap:{url}"
+    cached = cache.get(key)
+    if cached is not None:
+        count("sitemap.fetch", "cache_hits")
+        return cached
+    count("sitemap.fetch", "cache_misses")
+    with timed("sitemap.fetch") as timer:
+        response = await get_async_http_client("sitemap").get(url, timeout=SITEMAP_TIMEOUT_SECONDS)
+        text = response.text if response.is_success else ""
+        timer.bytes = len(text)
+    cache.set(key, text)
+    return text
+
+
+def fetch_sitemap_urls(base_url: str) -> List[str]:
+    """Page URLs listed in ``base_url``'s sitemap.xml (following a sitemap index one level).
+
+    Fetched directly rather than through Firecrawl: it's a single small XML
+    file and costs no scrape credits. Errors yield an empty list.
+    """
+    try:
+        urls, is_index = parse_sitemap(_sitemap_text(f"{base_url}/sitemap.xml"))
+        if is_index:
+            urls = [url for child in urls[:MAX_CHILD_SITEMAPS] for url in parse_sitemap(_sitemap_text(child))[0]]
+        return urls
+    except Exception:
+        return []
+
+
+async def fetch_sitemap_urls_async(base_url: str) -> List[str]:
+    """Async fetch_sitemap_urls; child sitemaps of an index are fetched concurrently."""
+    try:
+        urls, is_index = parse_sitemap(await _sitemap_text_async(f"{base_url}/sitemap.xml"))
+        if is_index:
+            texts = await asyncio.gather(
+                *(_sitemap_text_async(child) for child in urls[:MAX_CHILD_SITEMAPS]),
+                return_exceptions=True,
+            )
+            urls = [url for text in texts if isinstance(text, str) for url in parse_sitemap(text)[0]]
+        return urls
+    except Exception:
+        return []
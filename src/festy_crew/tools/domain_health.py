@@ -0,0 +1,192 @@
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from festy_crew.utils.festival_key import normalize_domain
+
+DEFAULT_NEGATIVE_TTL = 900  # seconds a failed URL is not retried
+DEFAULT_FAILURE_THRESHOLD = 3  # consecutive failures that open a domain's circuit
+DEFAULT_COOLDOWN = 600  # seconds a domain stays open before one trial request
+
+# Statuses that say nothing about the site itself: our Firecrawl key, credits or rate limit
+_API_STATUSES = (401, 402, 429)
+MISSING_STATUSES = (404, 410)
+
+
+class ScrapeFailedError(RuntimeError):
+    """A scrape that failed, or was skipped because its URL or domain failed recently."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status  # the site's HTTP status, for error pages
+
+
+def failure_reason(error: BaseException) -> Optional[str]:
+    """Short description of why a scrape failed, or None if the site isn't to blame."""
+    name = type(error).__name__
+    status = getattr(error, "status_code", None)
+    if status in _API_STATUSES or name in ("ScrapeRejectedError", "DeadlineExceededError"):
+        return None
+    if isinstance(error, ScrapeFailedError):
+        return None  # a skip, or an error page already recorded by record_status
+    if isinstance(error, TimeoutError) or status == 408 or "Timeout" in name:
+        return "timed out"
+    if status == 403 or name == "WebsiteNotSupportedError":
+        return "blocked or not supported by the scraper"
+    if status:
+        return f"scraper error {status}"
+    return f"{name}: {str(error)[:120]}" if str(error) else name
+
+
+class _DomainState:
+    __slots__ = ("failures", "reason", "open_until", "trial")
+
+    def __init__(self):
+        self.failures = 0
+        self.reason = ""
+        self.open_until = 0.0
+        self.trial = False  # a half-open trial request is in flight
+
+
+class DomainHealth:
+    """Per-domain scrape health shared by every scrape tool in the process.
+
+    URLs that returned 404/410 or failed are negatively cached for
+    ``negative_ttl`` seconds. After ``failure_threshold`` consecutive failures
+    (timeouts, blocks, server errors; 404s only affect their URL) a domain's
+    circuit opens and every scrape of it fails immediately with the recorded
+    reason. After ``cooldown`` seconds one trial request is let through: success
+    closes the circuit, failure opens it again. The trial starts when the
+    request is dispatched (``begin_request``) and is released by ``end_request``
+    if it never got an outcome, e.g. when it was cancelled.
+    """
+
+    def __init__(
+        self,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN,
+    ):
+        self.negative_ttl = negative_ttl
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._domains: Dict[str, _DomainState] = {}
+        self._urls: Dict[str, Tuple[float, str]] = {}  # url -> (failed at, reason)
+        self.short_circuited = 0
+
+    def _circuit_reason(
+        self, url: str, domain: str, state: Optional[_DomainState], now: float
+    ) -> Optional[str]:
+        """Skip message while ``domain``'s circuit is open or its trial is in flight."""
+        if state is None or not state.open_until or (now >= state.open_until and not state.trial):
+            return None
+        self.short_circuited += 1
+        wait = max(state.open_until - now, 0)
+        return (
+            f"skipped {url}: {domain} failed {state.failures} times in a row "
+            f"(last: {state.reason}); not retrying for {wait:.0f}s"
+        )
+
+    def check(self, url: str) -> Optional[str]:
+        """Why ``url`` should not be scraped right now, or None if it may be."""
+        domain = normalize_domain(url)
+        now = time.monotonic()
+        with self._lock:
+            state = self._domains.get(domain)
+            reason = self._circuit_reason(url, domain, state, now)
+            if reason is not None or (state is not None and state.open_until):
+                return reason
+            failed = self._urls.get(url)
+            if failed is not None:
+                at, reason = failed
+                if now - at < self.negative_ttl:
+                    self.short_circuited += 1
+                    return f"skipped {url}: it failed {now - at:.0f}s ago ({reason})"
+                del self._urls[url]
+        return None
+
+    def begin_request(self, url: str) -> bool:
+        """Call as a request to ``url`` is dispatched; True if it is its domain's trial.
+
+        Raises ScrapeFailedError if the domain's circuit is open or another
+        request is already testing it. A trial request must be followed by
+        ``end_request`` whatever happens to it.
+        """
+        domain = normalize_domain(url)
+        with self._lock:
+            state = self._domains.get(domain)
+            reason = self._circuit_reason(url, domain, state, time.monotonic())
+            if reason is not None:
+                raise ScrapeFailedError(reason)
+            if state is None or not state.open_until:
+                return False
+            state.trial = True  # cooldown over: let this one request test the domain
+            return True
+
+    def end_request(self, url: str) -> None:
+        """Release a trial that ended without an outcome (cancelled, abandoned, cut short)."""
+        with self._lock:
+            state = self._domains.get(normalize_domain(url))
+            if state is not None:
+                state.trial = False
+
+    def record_success(self, url: str) -> None:
+        with self._lock:
+            self._urls.pop(url, None)
+            self._domains.pop(normalize_domain(url), None)
+
+    def record_failure(self, url: str, reason: str, domain_failure: bool = True) -> None:
+        """Negatively cache ``url``; a ``domain_failure`` also counts towards its circuit."""
+        now = time.monotonic()
+        with self._lock:
+            self._urls[url] = (now, reason)
+            if not domain_failure:
+                state = self._domains.get(normalize_domain(url))
+                if state is not None:
+                    state.trial = False  # the domain answered; the next request may test it
+                return
+            state = self._domains.setdefault(normalize_domain(url), _DomainState())
+            state.failures += 1
+            state.reason = reason
+            if state.trial or state.failures >= self.failure_threshold:
+                state.open_until = now + self.cooldown
+                state.trial = False
+
+    def record_status(self, url: str, status: Optional[int]) -> None:
+        """Record a scrape that got an HTTP response from the site."""
+        if status is None or status < 400:
+            self.record_success(url)
+        else:
+            self.record_failure(url, f"HTTP {status}", domain_failure=status not in MISSING_STATUSES)
+
+    def open_domains(self) -> Dict[str, str]:
+        """Domains whose circuit is open, with the reason."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                domain: f"{state.failures} consecutive failures, last: {state.reason}"
+                for domain, state in self._domains.items()
+                if state.open_until > now
+            }
+
+
+_health: Optional[DomainHealth] = None
+_health_lock = threading.Lock()
+
+
+def get_domain_health() -> DomainHealth:
+    """Return the shared DomainHealth, tuned by FESTY_DOMAIN_NEGATIVE_TTL,
+    FESTY_DOMAIN_FAILURE_THRESHOLD and FESTY_DOMAIN_COOLDOWN."""
+    global _health
+    with _health_lock:
+        if _health is None:
+            _health = DomainHealth(
+                negative_ttl=float(os.getenv("FESTY_DOMAIN_NEGATIVE_TTL", DEFAULT_NEGATIVE_TTL)),
+                failure_threshold=int(
+                    os.getenv("FESTY_DOMAIN_FAILURE_THRESHOLD", DEFAULT_FAILURE_THRESHOLD)
+                ),
+                cooldown=float(os.getenv("FESTY_DOMAIN_COOLDOWN", DEFAULT_COOLDOWN)),
+            )
+        return _health
@@ -1,28 +1,211 @@
+import asyncio
 import concurrent.futures
-import os
+import time
+from typing import Dict, List, Optional, Tuple
+
 from crewai.tools import BaseTool
 from pydantic import Field
 
+from festy_crew.tools.clients import get_async_firecrawl_client, get_firecrawl_client
+from festy_crew.tools.content_select import _EMAIL_RE, select_content
+from festy_crew.tools.crawl_frontier import (
+    extract_links,
+    fetch_sitemap_urls,
+    fetch_sitemap_urls_async,
+    is_soft_404,
+    rank_candidates,
+)
+from festy_crew.tools.domain_health import (
+    MISSING_STATUSES,
+    ScrapeFailedError,
+    failure_reason,
+    get_domain_health,
+)
+from festy_crew.tools.scrape_cache import get_scrape_cache
+from festy_crew.tools.scrape_executor import get_async_scrape_slots, get_scrape_executor
+from festy_crew.tools.timeouts import (
+    budget_exhausted,
+    budget_remaining,
+    get_host_latency,
+    mark_cut_short,
+    request_timeout,
+)
+from festy_crew.utils.festival_key import normalize_domain
+from festy_crew.utils.metrics import count, timed
+
+SCRAPE_TIMEOUT_SECONDS = 20  # until a host has enough latency samples for an adaptive timeout
+
+# Token budgets for page content handed to the LLM (about 4 characters per token)
+SCRAPE_TOKEN_BUDGET = 500
+CONTACT_PAGE_TOKEN_BUDGET = 250
+HOMEPAGE_TOKEN_BUDGET = 300
+
+
+def _scrape_timeout(url: str) -> Tuple[float, bool]:
+    """(timeout, clipped) for scraping ``url``: adaptive per host, within the festival budget."""
+    return request_timeout(normalize_domain(url) or url, SCRAPE_TIMEOUT_SECONDS)
+
+
+def _record_error(url: str, error: BaseException, timeout_seconds: float, clipped: bool) -> None:
+    reason = failure_reason(error)
+    if reason is None:
+        return
+    if reason == "timed out":
+        if clipped:
+            mark_cut_short()
+            return  # cut short by the festival budget, not the site's fault
+        # All we know is that it takes at least this long
+        get_host_latency().observe(normalize_domain(url) or url, timeout_seconds)
+    get_domain_health().record_failure(url, reason)
+
 
-def _scrape_with_timeout(app, url: str, timeout_seconds: int = 20):
-    """Run a Firecrawl scrape with a hard timeout to prevent hangs."""
-    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-    future = executor.submit(app.scrape, url, formats=["markdown"])
+def _page_markdown(url: str, result) -> str:
+    """Markdown of a scrape result, recording the site's status in DomainHealth.
+
+    Raises ScrapeFailedError for error pages (404 etc.) instead of returning
+    the error page's text; only real pages reach the scrape cache.
+    """
+    status = getattr(getattr(result, "metadata", None), "status_code", None)
+    get_domain_health().record_status(url, status)
+    if status is not None and status >= 400:
+        raise ScrapeFailedError(f"{url} returned HTTP {status}", status)
+    markdown = result.markdown or ""
+    get_scrape_cache().set(url, markdown)
+    return markdown
+
+
+def _scrape_markdown(url: str, timeout_seconds: float, clipped: bool = False) -> str:
+    """Scrape ``url`` and cache its markdown. Runs on a scrape executor worker."""
+    health = get_domain_health()
+    trial = health.begin_request(url)
+    # Firecrawl's own timeout (ms) bounds the request so abandoned workers free up
     try:
-        result = future.result(timeout=timeout_seconds)
-        executor.shutdown(wait=False)
-        return result
-    except concurrent.futures.TimeoutError:
-        executor.shutdown(wait=False)
-        return None
+        with timed("firecrawl.scrape") as timer:
+            start = time.monotonic()
+            try:
+                result = get_firecrawl_client().scrape(
+                    url, formats=["markdown"], timeout=int(timeout_seconds * 1000)
+                )
+            except Exception as e:
+                _record_error(url, e, timeout_seconds, clipped)
+                raise
+            get_host_latency().observe(normalize_domain(url) or url, time.monotonic() - start)
+            markdown = _page_markdown(url, result)
+            timer.bytes = len(markdown)
+        return markdown
+    finally:
+        if trial:
+            health.end_request(url)
+
+
+def _skipped(url: str) -> Optional[str]:
+    """Why ``url`` is not worth scraping now (it or its domain failed recently), if so."""
+    reason = get_domain_health().check(url)
+    if reason is not None:
+        count("firecrawl.scrape", "short_circuited")
+    return reason
+
 
+def _submit_scrape(
+    url: str,
+    timeout_seconds: Optional[float] = None,
+    clipped: bool = False,
+    queue_timeout: Optional[float] = None,
+) -> concurrent.futures.Future:
+    """Return a future for ``url``'s markdown, already resolved on a cache hit.
 
-def _get_firecrawl_client():
-    from firecrawl import FirecrawlApp
-    api_key = os.getenv("FIRECRAWL_API_KEY")
-    if not api_key:
-        raise ValueError("FIRECRAWL_API_KEY environment variable is not set")
-    return FirecrawlApp(api_key=api_key)
+    Without ``timeout_seconds`` the host's adaptive timeout is used. A
+    ``queue_timeout`` shortens the wait for room in a saturated executor.
+    Raises DeadlineExceededError on a miss once the festival's budget is used up.
+    """
+    cached = get_scrape_cache().get(url)
+    if cached is not None:
+        count("firecrawl.scrape", "cache_hits")
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        future.set_result(cached)
+        return future
+    count("firecrawl.scrape", "cache_misses")
+    reason = _skipped(url)
+    if reason is not None:
+        future = concurrent.futures.Future()
+        future.set_exception(ScrapeFailedError(reason))
+        return future
+    if timeout_seconds is None:
+        timeout_seconds, clipped = _scrape_timeout(url)
+    executor = get_scrape_executor()
+    if queue_timeout is None:
+        queue_timeout = executor.queue_timeout
+    return executor.submit_within(queue_timeout, _scrape_markdown, url, timeout_seconds, clipped)
+
+
+def _cached_scrape(url: str) -> Optional[str]:
+    """Return markdown for ``url`` from the scrape cache, scraping on a miss.
+
+    Returns None if the scrape timed out. Scrape errors propagate, including
+    ScrapeFailedError for error pages and for URLs or domains that failed
+    recently, and DeadlineExceededError once the festival's budget is used
+    up. The timeout adapts to the host's recent latency. The Firecrawl client
+    is only created when the network is actually needed.
+    """
+    timeout_seconds, clipped = _scrape_timeout(url)
+    markdown = get_scrape_executor().wait(_submit_scrape(url, timeout_seconds, clipped), timeout_seconds)
+    if markdown is None:
+        count("firecrawl.scrape", "timeouts")
+        if clipped:
+            mark_cut_short()
+    return markdown
+
+
+async def _cached_scrape_async(url: str) -> Optional[str]:
+    """Async _cached_scrape using AsyncFirecrawl; no thread is held while waiting.
+
+    The timeout covers waiting for a scrape slot as well as the request, and
+    cancels the request cleanly when it fires. Returns None on timeout.
+    """
+    cache = get_scrape_cache()
+    cached = cache.get(url)
+    if cached is not None:
+        count("firecrawl.scrape", "cache_hits")
+        return cached
+    count("firecrawl.scrape", "cache_misses")
+    reason = _skipped(url)
+    if reason is not None:
+        raise ScrapeFailedError(reason)
+    timeout_seconds, clipped = _scrape_timeout(url)
+    started: Optional[float] = None  # when a scrape slot was acquired
+    trial = False  # this request is testing its domain's half-open circuit
+
+    async def scrape():
+        nonlocal started, trial
+        async with get_async_scrape_slots():
+            trial = get_domain_health().begin_request(url)
+            started = time.monotonic()
+            return await get_async_firecrawl_client().scrape(
+                url, formats=["markdown"], timeout=int(timeout_seconds * 1000)
+            )
+
+    try:
+        with timed("firecrawl.scrape") as timer:
+            timer_start = time.monotonic()
+            try:
+                result = await asyncio.wait_for(scrape(), timeout_seconds)
+            except asyncio.TimeoutError as e:
+                timer.timeout = True
+                if clipped:
+                    mark_cut_short()
+                elif started is not None:  # time spent waiting for a slot isn't the site's fault
+                    _record_error(url, e, timeout_seconds - (started - timer_start), clipped)
+                return None
+            except Exception as e:
+                _record_error(url, e, timeout_seconds, clipped)
+                raise
+            get_host_latency().observe(normalize_domain(url) or url, time.monotonic() - started)
+            markdown = _page_markdown(url, result)
+            timer.bytes = len(markdown)
+        return markdown
+    finally:
+        if trial:  # recorded outcomes already ended it; this covers cancellation and clipping
+            get_domain_health().end_request(url)
 
 
 class FirecrawlScrapeTool(BaseTool):
@@ -33,16 +216,23 @@ class FirecrawlScrapeTool(BaseTool):
         "Input: url (str) - the full URL to scrape."
     )
 
+    @staticmethod
+    def _format(url: str, markdown: Optional[str]) -> str:
+        if markdown is None:
+            return f"Timed out retrieving content from {url}"
+        if not markdown:
+            return f"No content retrieved from {url}"
+        return select_content(markdown, SCRAPE_TOKEN_BUDGET)
+
     def _run(self, url: str) -> str:
         try:
-            app = _get_firecrawl_client()
-            result = _scrape_with_timeout(app, url)
-            if result is None:
-                return f"Timed out retrieving content from {url}"
-            markdown = result.markdown or ""
-            if not markdown:
-                return f"No content retrieved from {url}"
-            return markdown[:3000]
+            return self._format(url, _cached_scrape(url))
+        except Exception as e:
+            return f"Could not retrieve content from {url}: {e}"
+
+    async def _arun(self, url: str) -> str:
+        try:
+            return self._format(url, await _cached_scrape_async(url))
         except Exception as e:
             return f"Could not retrieve content from {url}: {e}"
 
@@ -56,21 +246,36 @@ class FirecrawlSearchTool(BaseTool):
     )
     limit: int = Field(default=5)
 
+    @staticmethod
+    def _format(query: str, items: list) -> str:
+        if not items:
+            return f"No results found for query: {query}"
+
+        formatted = []
+        for item in items:
+            url = getattr(item, "url", "")
+            title = getattr(item, "title", None) or "No title"
+            description = getattr(item, "description", None) or ""
+            formatted.append(f"URL: {url}\nTitle: {title}\nSnippet: {description}\n")
+        return "\n".join(formatted)
+
     def _run(self, query: str, limit: int = 5) -> str:
         try:
-            app = _get_firecrawl_client()
-            result = app.search(query, limit=limit)
-            items = result.web or []
-            if not items:
-                return f"No results found for query: {query}"
-
-            formatted = []
-            for item in items:
-                url = getattr(item, "url", "")
-                title = getattr(item, "title", None) or "No title"
-                description = getattr(item, "description", None) or ""
-                formatted.append(f"URL: {url}\nTitle: {title}\nSnippet: {description}\n")
-            return "\n".join(formatted)
+            with timed("firecrawl.search") as timer:
+                result = get_firecrawl_client().search(query, limit=limit)
+                items = result.web or []
+                timer.bytes = sum(len(getattr(item, "description", None) or "") for item in items)
+            return self._format(query, items)
+        except Exception as e:
+            return f"Search failed: {e}"
+
+    async def _arun(self, query: str, limit: int = 5) -> str:
+        try:
+            with timed("firecrawl.search") as timer:
+                result = await get_async_firecrawl_client().search(query, limit=limit)
+                items = result.web or []
+                timer.bytes = sum(len(getattr(item, "description", None) or "") for item in items)
+            return self._format(query, items)
         except Exception as e:
             return f"Search failed: {e}"
 
@@ -78,38 +283,191 @@ class FirecrawlSearchTool(BaseTool):
 class WebsiteContactFinderTool(BaseTool):
     name: str = "WebsiteContactFinderTool"
     description: str = (
-        "Crawls common contact-related pages on a festival website to find organizer contact info. "
-        "Checks /contact, /about, /team, /press, /organizers, /submissions pages. "
+        "Finds organizer contact info on a festival website. Reads the homepage's links and "
+        "sitemap.xml, picks the pages most likely to list contacts (contact, team, press, about; "
+        "in English, Japanese, Korean or Thai) and scrapes them together. "
         "Input: base_url (str) - the festival's base website URL (e.g. https://festival.com)."
     )
+    # Probed only when the homepage and sitemap turn up no contact-like links
+    contact_paths: List[str] = Field(
+        default=["/contact", "/about", "/team", "/press", "/organizers", "/submissions"]
+    )
+    max_pages: int = Field(default=4)  # candidate pages scraped after the homepage
+    # Overall budget for the homepage and probes, cut to what is left of the festival's budget
+    deadline_seconds: float = Field(default=45.0)
+    min_emails: int = Field(default=0)  # stop early once this many emails are found; 0 = off
 
-    def _run(self, base_url: str) -> str:
-        app = _get_firecrawl_client()
-        contact_paths = ["/contact", "/about", "/team", "/press", "/organizers", "/submissions"]
-        base_url = base_url.rstrip("/")
-        aggregated = []
+    def _frontier(self, base_url: str, homepage: Optional[str], sitemap_urls: List[str]) -> List[str]:
+        """The pages to scrape, best first: ranked homepage links and sitemap entries."""
+        links = extract_links(homepage or "", base_url) + [(url, "") for url in sitemap_urls]
+        urls = rank_candidates(base_url, links, self.max_pages)
+        return urls or [f"{base_url}{path}" for path in self.contact_paths[: self.max_pages]]
+
+    def _deadline(self) -> float:
+        remaining = budget_remaining()
+        seconds = self.deadline_seconds if remaining is None else min(self.deadline_seconds, remaining)
+        return time.monotonic() + max(seconds, 0)
+
+    @staticmethod
+    def _unreachable(homepage: Optional[str], error: Optional[Exception]) -> bool:
+        """The homepage timed out or failed (not just a 404): don't spend probes on the site."""
+        return homepage is None and getattr(error, "status", None) not in MISSING_STATUSES
+
+    @staticmethod
+    def _usable(markdown: Optional[str]) -> bool:
+        return bool(markdown) and len(markdown) > 100 and not is_soft_404(markdown)
 
-        for path in contact_paths:
-            url = f"{base_url}{path}"
+    def _probe_urls(self, urls: List[str], deadline: float) -> Dict[str, str]:
+        """Scrape ``urls`` concurrently, returning url -> markdown for usable pages."""
+        pages: Dict[str, str] = {}
+        emails = set()
+        enough = False  # stopped once min_emails were found, not at the deadline
+
+        executor = get_scrape_executor()
+        pending = {}
+        unsent = 0  # URLs not submitted because the deadline passed first
+        for n, url in enumerate(urls):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                unsent = len(urls) - n
+                break
             try:
-                result = _scrape_with_timeout(app, url)
-                if result is None:
-                    continue
-                markdown = result.markdown or ""
-                if markdown and len(markdown) > 100:
-                    aggregated.append(f"=== {url} ===\n{markdown[:1500]}")
+                # Never wait longer for room in a saturated executor than the tool has left
+                pending[_submit_scrape(url, queue_timeout=remaining)] = url
             except Exception:
                 continue
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, _ = concurrent.futures.wait(
+                    pending, timeout=remaining, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    url = pending.pop(future)
+                    try:
+                        markdown = future.result()
+                    except Exception:
+                        continue
+                    if self._usable(markdown):
+                        pages[url] = markdown
+                        emails.update(m.lower() for m in _EMAIL_RE.findall(markdown))
+                enough = bool(self.min_emails) and len(emails) >= self.min_emails
+                if enough:
+                    break
+        finally:
+            for future in pending:
+                executor.abandon(future)
+            count("firecrawl.scrape", "cancelled" if enough else "timeouts", len(pending))
+            count("firecrawl.scrape", "timeouts", unsent)
+            if (pending or unsent) and not enough and budget_exhausted():
+                mark_cut_short()
+        return pages
 
-        if not aggregated:
-            try:
-                result = _scrape_with_timeout(app, base_url)
-                if result is None:
-                    return f"Timed out retrieving contact information from {base_url}"
-                markdown = result.markdown or ""
-                if markdown:
-                    aggregated.append(f"=== {base_url} (homepage) ===\n{markdown[:2000]}")
-            except Exception as e:
-                return f"Could not retrieve any contact information from {base_url}: {e}"
+    async def _aprobe_urls(self, urls: List[str], deadline: float) -> Dict[str, str]:
+        """Async _probe_urls; unfinished scrapes are cancelled and awaited at the deadline."""
+        tasks = {asyncio.ensure_future(_cached_scrape_async(url)): url for url in urls}
+        pending = set(tasks)
+        pages: Dict[str, str] = {}
+        emails = set()
+        enough = False
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        continue
+                    markdown = task.result()
+                    if self._usable(markdown):
+                        pages[tasks[task]] = markdown
+                        emails.update(m.lower() for m in _EMAIL_RE.findall(markdown))
+                enough = bool(self.min_emails) and len(emails) >= self.min_emails
+                if enough:
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            count("firecrawl.scrape", "cancelled" if enough else "timeouts", len(pending))
+            if pending and not enough and budget_exhausted():
+                mark_cut_short()
+        return pages
+
+    @staticmethod
+    def _report(
+        base_url: str,
+        urls: List[str],
+        pages: Dict[str, str],
+        homepage: Optional[str],
+        error: Optional[Exception] = None,
+    ) -> str:
+        # Pages in frontier order regardless of completion order; the homepage
+        # leads when it has emails of its own (often in the footer)
+        sections = [
+            f"=== {url} ===\n{select_content(pages[url], CONTACT_PAGE_TOKEN_BUDGET)}"
+            for url in urls
+            if url in pages
+        ]
+        if homepage and (not sections or _EMAIL_RE.search(homepage)):
+            selected = select_content(homepage, HOMEPAGE_TOKEN_BUDGET)
+            sections.insert(0, f"=== {base_url} (homepage) ===\n{selected}")
+        if sections:
+            return "\n\n".join(sections)
+        if error is not None:
+            return f"Could not retrieve any contact information from {base_url}: {error}"
+        if homepage is None:
+            return f"Timed out retrieving contact information from {base_url}"
+        return f"No contact information found at {base_url}"
+
+    def _run(self, base_url: str) -> str:
+        base_url = base_url.rstrip("/")
+        deadline = self._deadline()
+        executor = get_scrape_executor()
+
+        try:
+            sitemap = executor.submit_within(deadline - time.monotonic(), fetch_sitemap_urls, base_url)
+        except Exception:
+            sitemap = None
+        homepage, error = None, None
+        try:
+            homepage = _cached_scrape(base_url)
+        except Exception as e:
+            error = e
+        if self._unreachable(homepage, error):
+            if sitemap:
+                executor.abandon(sitemap)
+            return self._report(base_url, [], {}, homepage, error)
+        sitemap_urls = executor.wait(sitemap, max(deadline - time.monotonic(), 0)) if sitemap else None
+
+        urls = self._frontier(base_url, homepage, sitemap_urls or [])
+        pages = self._probe_urls(urls, deadline)
+        return self._report(base_url, urls, pages, homepage, error)
+
+    async def _arun(self, base_url: str) -> str:
+        base_url = base_url.rstrip("/")
+        deadline = self._deadline()
+
+        sitemap = asyncio.ensure_future(fetch_sitemap_urls_async(base_url))
+        homepage, error = None, None
+        try:
+            homepage = await _cached_scrape_async(base_url)
+        except Exception as e:
+            error = e
+        if self._unreachable(homepage, error):
+            sitemap.cancel()
+            await asyncio.gather(sitemap, return_exceptions=True)
+            return self._report(base_url, [], {}, homepage, error)
+        try:
+            sitemap_urls = await asyncio.wait_for(sitemap, max(deadline - time.monotonic(), 0))
+        except asyncio.TimeoutError:
+            sitemap_urls = []
 
-        return "\n\n".join(aggregated) if aggregated else f"No contact information found at {base_url}"
+        urls = self._frontier(base_url, homepage, sitemap_urls)
+        pages = await self._aprobe_urls(urls, deadline)
+        return self._report(base_url, urls, pages, homepage, error)
@@ -0,0 +1,193 @@
+import asyncio
+import concurrent.futures
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from festy_crew.utils.metrics import count
+
+
+DEFAULT_CACHE_PATH = ".festy_cache/hunter_cache.sqlite"
+DEFAULT_TTLS = {
+    "domain-search": 3 * 24 * 3600,
+    "email-verifier": 30 * 24 * 3600,
+}
+
+
+class HunterCache:
+    """Persistent cache of Hunter API payloads with single-flight lookups.
+
+    Entries are keyed by (endpoint, key) where the key is a normalized domain
+    or a lowercased email, and expire after the endpoint's TTL. Concurrent
+    ``get_or_fetch`` calls for the same entry share one API call.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttls: Optional[Dict[str, float]] = None,
+        enabled: bool = True,
+        refresh: bool = False,
+    ):
+        self.path = path
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.enabled = enabled
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self.collapsed = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._inflight: Dict[Tuple[str, str], concurrent.futures.Future] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS hunter ("
+                " endpoint TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL,"
+                " PRIMARY KEY (endpoint, key))"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, endpoint: str, key: str) -> Optional[dict]:
+        if not self.enabled or self.refresh:
+            return None
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT payload, fetched_at FROM hunter WHERE endpoint = ? AND key = ?",
+                (endpoint, key),
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.ttls.get(endpoint, 0):
+            return None
+        return json.loads(row[0])
+
+    def set(self, endpoint: str, key: str, payload: dict) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO hunter (endpoint, key, payload, fetched_at)"
+                " VALUES (?, ?, ?, ?)",
+                (endpoint, key, json.dumps(payload), time.time()),
+            )
+            conn.commit()
+
+    def _claim(
+        self, endpoint: str, key: str
+    ) -> Tuple[Optional[dict], Optional[concurrent.futures.Future], bool]:
+        """Look up an entry: (cached payload, in-flight future, whether we must fetch)."""
+        payload = self.get(endpoint, key)
+        if payload is not None:
+            with self._lock:
+                self.hits += 1
+            count(f"hunter.{endpoint}", "cache_hits")
+            return payload, None, False
+
+        with self._lock:
+            future = self._inflight.get((endpoint, key))
+            owner = future is None
+            if owner:
+                future = self._inflight[(endpoint, key)] = concurrent.futures.Future()
+                self.misses += 1
+            else:
+                self.collapsed += 1
+        count(f"hunter.{endpoint}", "cache_misses" if owner else "cache_hits")
+        return None, future, owner
+
+    def _settle(
+        self, endpoint: str, key: str, future: concurrent.futures.Future, payload=None, error=None
+    ) -> None:
+        """Store a fetched payload and hand it (or the fetch error) to waiting callers."""
+        try:
+            if error is None:
+                self.set(endpoint, key, payload)
+        finally:
+            with self._lock:
+                self._inflight.pop((endpoint, key), None)
+            if error is None:
+                future.set_result(payload)
+            else:
+                future.set_exception(error)
+
+    def get_or_fetch(self, endpoint: str, key: str, fetch: Callable[[], dict]) -> dict:
+        """Return the cached payload, or call ``fetch`` once for all concurrent callers."""
+        payload, future, owner = self._claim(endpoint, key)
+        if payload is not None:
+            return payload
+        if not owner:
+            return future.result()
+        try:
+            payload = fetch()
+        except BaseException as e:
+            self._settle(endpoint, key, future, error=e)
+            raise
+        self._settle(endpoint, key, future, payload)
+        return payload
+
+    async def get_or_fetch_async(
+        self, endpoint: str, key: str, fetch: Callable[[], Awaitable[dict]]
+    ) -> dict:
+        """Async get_or_fetch; shares in-flight lookups with threaded callers."""
+        payload, future, owner = self._claim(endpoint, key)
+        if payload is not None:
+            return payload
+        if not owner:
+            # shield: a cancelled waiter must not cancel the owner's shared future
+            return await asyncio.shield(asyncio.wrap_future(future))
+        try:
+            payload = await fetch()
+        except BaseException as e:
+            self._settle(endpoint, key, future, error=e)
+            raise
+        self._settle(endpoint, key, future, payload)
+        return payload
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "collapsed": self.collapsed}
+
+
+_cache: Optional[HunterCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_hunter_cache() -> HunterCache:
+    """Return the process-wide Hunter cache, configured from the environment.
+
+    FESTY_HUNTER_CACHE_PATH, FESTY_HUNTER_DOMAIN_TTL and FESTY_HUNTER_VERIFY_TTL
+    (seconds) override the defaults; FESTY_NO_CACHE=1 disables it.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = HunterCache(
+                path=os.getenv("FESTY_HUNTER_CACHE_PATH", DEFAULT_CACHE_PATH),
+                ttls={
+                    "domain-search": float(
+                        os.getenv("FESTY_HUNTER_DOMAIN_TTL", DEFAULT_TTLS["domain-search"])
+                    ),
+                    "email-verifier": float(
+                        os.getenv("FESTY_HUNTER_VERIFY_TTL", DEFAULT_TTLS["email-verifier"])
+                    ),
+                },
+                enabled=os.getenv("FESTY_NO_CACHE", "") not in ("1", "true", "yes"),
+            )
+        return _cache
+
+
+def configure_hunter_cache(enabled: bool = True, refresh: bool = False) -> HunterCache:
+    """Apply command-line overrides (--no-cache / --refresh) to the shared cache."""
+    cache = get_hunter_cache()
+    cache.enabled = enabled
+    cache.refresh = refresh
+    return cache
@@ -1,18 +1,133 @@
+import asyncio
+import concurrent.futures
+import contextvars
 import os
+import re
 import time
-from typing import Optional
+from typing import List, Optional
+
+import httpx
 import requests
 from crewai.tools import BaseTool
 from pydantic import Field
 
+from festy_crew.tools.clients import get_async_http_client, get_http_session
+from festy_crew.tools.hunter_cache import get_hunter_cache
+from festy_crew.tools.rate_limit import call_with_backoff, call_with_backoff_async, get_rate_limiter
+from festy_crew.tools.timeouts import get_host_latency, mark_cut_short, request_timeout
+from festy_crew.utils.festival_key import normalize_domain
+from festy_crew.utils.metrics import timed
+
 
 HUNTER_BASE_URL = "https://api.hunter.io/v2"
+HUNTER_TIMEOUT_SECONDS = 10  # until an endpoint has enough latency samples for an adaptive timeout
 
 
 def _get_hunter_key() -> Optional[str]:
     return os.getenv("HUNTER_API_KEY") or None
 
 
+def _hunter_get(endpoint: str, params: dict) -> dict:
+    """GET a Hunter endpoint under its rate limit and return the "data" payload.
+
+    Each attempt's timeout adapts to the endpoint's recent latency and is cut
+    to the festival's remaining time budget, measured after any rate-limit or
+    429 wait (DeadlineExceededError once it is gone).
+    """
+    session = get_http_session("hunter")
+    host = f"hunter.{endpoint}"
+    timeout, clipped = HUNTER_TIMEOUT_SECONDS, False
+
+    def send():
+        nonlocal timeout, clipped
+        timeout, clipped = request_timeout(host, HUNTER_TIMEOUT_SECONDS)
+        start = time.monotonic()
+        resp = session.get(f"{HUNTER_BASE_URL}/{endpoint}", params=params, timeout=timeout)
+        get_host_latency().observe(host, time.monotonic() - start)
+        return resp
+
+    with timed(host) as timer:
+        try:
+            resp = call_with_backoff(send, get_rate_limiter(f"hunter/{endpoint}"))
+        except requests.Timeout:
+            timer.timeout = True
+            if clipped:
+                mark_cut_short()
+            else:
+                get_host_latency().observe(host, timeout)
+            raise
+        timer.bytes = len(resp.content)
+        resp.raise_for_status()
+        return resp.json().get("data", {})
+
+
+async def _hunter_get_async(endpoint: str, params: dict) -> dict:
+    """Async _hunter_get on the pooled httpx client; no thread is held while waiting."""
+    client = get_async_http_client("hunter")
+    host = f"hunter.{endpoint}"
+    timeout, clipped = HUNTER_TIMEOUT_SECONDS, False
+
+    async def send():
+        nonlocal timeout, clipped
+        timeout, clipped = request_timeout(host, HUNTER_TIMEOUT_SECONDS)
+        start = time.monotonic()
+        resp = await client.get(f"{HUNTER_BASE_URL}/{endpoint}", params=params, timeout=timeout)
+        get_host_latency().observe(host, time.monotonic() - start)
+        return resp
+
+    with timed(host) as timer:
+        try:
+            resp = await call_with_backoff_async(send, get_rate_limiter(f"hunter/{endpoint}"))
+        except httpx.TimeoutException:
+            timer.timeout = True
+            if clipped:
+                mark_cut_short()
+            else:
+                get_host_latency().observe(host, timeout)
+            raise
+        timer.bytes = len(resp.content)
+        resp.raise_for_status()
+        return resp.json().get("data", {})
+
+
+def _domain_search(domain: str, limit: int, api_key: str) -> dict:
+    """Hunter domain search for an already-normalized domain, via the shared cache."""
+    return get_hunter_cache().get_or_fetch(
+        "domain-search",
+        f"{domain}|{limit}",
+        lambda: _hunter_get("domain-search", {"domain": domain, "limit": limit, "api_key": api_key}),
+    )
+
+
+async def _domain_search_async(domain: str, limit: int, api_key: str) -> dict:
+    return await get_hunter_cache().get_or_fetch_async(
+        "domain-search",
+        f"{domain}|{limit}",
+        lambda: _hunter_get_async(
+            "domain-search", {"domain": domain, "limit": limit, "api_key": api_key}
+        ),
+    )
+
+
+def _format_domain_search(domain: str, data: dict) -> str:
+    emails = data.get("emails", [])
+    if not emails:
+        return f"No emails found for domain: {domain}"
+
+    lines = []
+    for entry in emails:
+        email = entry.get("value", "")
+        confidence = entry.get("confidence", "")
+        position = entry.get("position", "")
+        first = entry.get("first_name", "")
+        last = entry.get("last_name", "")
+        name = f"{first} {last}".strip()
+        lines.append(
+            f"Email: {email} | Confidence: {confidence}% | Name: {name} | Position: {position}"
+        )
+    return "\n".join(lines)
+
+
 class HunterDomainSearchTool(BaseTool):
     name: str = "HunterDomainSearchTool"
     description: str = (
@@ -28,34 +143,49 @@ class HunterDomainSearchTool(BaseTool):
         if not api_key:
             return "HUNTER_API_KEY not configured — skipping Hunter domain lookup"
 
-        domain = domain.replace("https://", "").replace("http://", "").split("/")[0]
+        domain = normalize_domain(domain)
         try:
-            resp = requests.get(
-                f"{HUNTER_BASE_URL}/domain-search",
-                params={"domain": domain, "limit": limit, "api_key": api_key},
-                timeout=10,
-            )
-            resp.raise_for_status()
-            data = resp.json().get("data", {})
-            emails = data.get("emails", [])
-            if not emails:
-                return f"No emails found for domain: {domain}"
-
-            lines = []
-            for entry in emails:
-                email = entry.get("value", "")
-                confidence = entry.get("confidence", "")
-                position = entry.get("position", "")
-                first = entry.get("first_name", "")
-                last = entry.get("last_name", "")
-                name = f"{first} {last}".strip()
-                lines.append(
-                    f"Email: {email} | Confidence: {confidence}% | Name: {name} | Position: {position}"
-                )
-            return "\n".join(lines)
+            return _format_domain_search(domain, _domain_search(domain, limit, api_key))
         except Exception as e:
             return f"Hunter lookup failed: {e}"
 
+    async def _arun(self, domain: str, limit: int = 10) -> str:
+        api_key = _get_hunter_key()
+        if not api_key:
+            return "HUNTER_API_KEY not configured — skipping Hunter domain lookup"
+
+        domain = normalize_domain(domain)
+        try:
+            return _format_domain_search(domain, await _domain_search_async(domain, limit, api_key))
+        except Exception as e:
+            return f"Hunter lookup failed: {e}"
+
+
+def _verify_email(email: str, api_key: str) -> dict:
+    """Verify one address through the shared cache and rate limiter."""
+    email = email.strip()
+    return get_hunter_cache().get_or_fetch(
+        "email-verifier",
+        email.lower(),
+        lambda: _hunter_get("email-verifier", {"email": email, "api_key": api_key}),
+    )
+
+
+async def _verify_email_async(email: str, api_key: str) -> dict:
+    email = email.strip()
+    return await get_hunter_cache().get_or_fetch_async(
+        "email-verifier",
+        email.lower(),
+        lambda: _hunter_get_async("email-verifier", {"email": email, "api_key": api_key}),
+    )
+
+
+def _format_verification(email: str, data: dict) -> str:
+    status = data.get("status", "unknown")
+    score = data.get("score", "")
+    result = data.get("result", "")
+    return f"Email: {email} | Status: {status} | Score: {score} | Result: {result}"
+
 
 class HunterEmailVerifierTool(BaseTool):
     name: str = "HunterEmailVerifierTool"
@@ -70,18 +200,85 @@ class HunterEmailVerifierTool(BaseTool):
         if not api_key:
             return "HUNTER_API_KEY not configured — skipping email verification"
 
-        time.sleep(1)  # rate limiting
+        email = email.strip()
         try:
-            resp = requests.get(
-                f"{HUNTER_BASE_URL}/email-verifier",
-                params={"email": email, "api_key": api_key},
-                timeout=10,
-            )
-            resp.raise_for_status()
-            data = resp.json().get("data", {})
-            status = data.get("status", "unknown")
-            score = data.get("score", "")
-            result = data.get("result", "")
-            return f"Email: {email} | Status: {status} | Score: {score} | Result: {result}"
+            return _format_verification(email, _verify_email(email, api_key))
         except Exception as e:
             return f"Hunter verification failed: {e}"
+
+    async def _arun(self, email: str) -> str:
+        api_key = _get_hunter_key()
+        if not api_key:
+            return "HUNTER_API_KEY not configured — skipping email verification"
+
+        email = email.strip()
+        try:
+            return _format_verification(email, await _verify_email_async(email, api_key))
+        except Exception as e:
+            return f"Hunter verification failed: {e}"
+
+
+class HunterBatchEmailVerifierTool(BaseTool):
+    name: str = "HunterBatchEmailVerifierTool"
+    description: str = (
+        "Verifies a list of email addresses at once using Hunter.io and returns one table, "
+        "in the order given. Use this to confirm all emails found during contact research "
+        "in a single step. Input: emails (list of str) - the email addresses to verify."
+    )
+    max_workers: int = Field(default=5)
+
+    @staticmethod
+    def _unique(emails: List[str]) -> List[str]:
+        if isinstance(emails, str):
+            emails = re.split(r"[,;\s]+", emails)
+        # Drop blanks and repeats but keep the caller's order
+        return list(dict.fromkeys(e.strip() for e in emails if e and e.strip()))
+
+    @staticmethod
+    def _format_table(unique: List[str], outcomes: list) -> str:
+        lines = ["Email | Status | Score | Result"]
+        for email, data in zip(unique, outcomes):
+            if isinstance(data, BaseException):
+                lines.append(f"{email} | error | | verification failed: {data}")
+            else:
+                lines.append(
+                    f"{email} | {data.get('status', 'unknown')} | "
+                    f"{data.get('score', '')} | {data.get('result', '')}"
+                )
+        return "\n".join(lines)
+
+    def _run(self, emails: List[str]) -> str:
+        api_key = _get_hunter_key()
+        if not api_key:
+            return "HUNTER_API_KEY not configured — skipping email verification"
+
+        unique = self._unique(emails)
+        if not unique:
+            return "No email addresses provided"
+
+        # The rate limiter paces the actual API calls; threads only overlap the waits
+        workers = max(1, min(self.max_workers, len(unique)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            # Copy the caller's context so metrics stay attributed to its festival
+            futures = [
+                pool.submit(contextvars.copy_context().run, _verify_email, email, api_key)
+                for email in unique
+            ]
+
+        outcomes = [future.exception() or future.result() for future in futures]
+        return self._format_table(unique, outcomes)
+
+    async def _arun(self, emails: List[str]) -> str:
+        api_key = _get_hunter_key()
+        if not api_key:
+            return "HUNTER_API_KEY not configured — skipping email verification"
+
+        unique = self._unique(emails)
+        if not unique:
+            return "No email addresses provided"
+
+        # All lookups run as tasks on one loop; the rate limiter does the pacing
+        outcomes = await asyncio.gather(
+            *(_verify_email_async(email, api_key) for email in unique), return_exceptions=True
+        )
+        return self._format_table(unique, outcomes)
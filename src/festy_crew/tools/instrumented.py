@@ -0,0 +1,87 @@
+from typing import Any, List
+
+from crewai.tools import BaseTool
+
+from festy_crew.tools.timeouts import budget_exhausted, mark_cut_short
+from festy_crew.utils.metrics import metrics_enabled, timed
+from festy_crew.utils.replay import arun_tool
+
+BUDGET_EXHAUSTED_MESSAGE = (
+    "Stopped: this festival's time budget is used up. Do not call any more tools; "
+    "give your final answer with what you have found so far."
+)
+
+
+class InstrumentedTool(BaseTool):
+    """Wraps a tool to time each call and count the bytes it returns."""
+
+    inner: BaseTool
+
+    def _generate_description(self):
+        # The wrapped tool's description is already fully rendered
+        self.description = self.inner.description
+
+    def _run(self, **kwargs: Any) -> Any:
+        with timed(f"tool:{self.name}") as timer:
+            result = self.inner._run(**kwargs)
+            timer.bytes = len(str(result))
+        return result
+
+    async def _arun(self, **kwargs: Any) -> Any:
+        with timed(f"tool:{self.name}") as timer:
+            result = await arun_tool(self.inner, kwargs)
+            timer.bytes = len(str(result))
+        return result
+
+
+def instrument_tools(tools: List[BaseTool]) -> List[BaseTool]:
+    """Wrap ``tools`` with timing when metrics are on; returns them unchanged otherwise."""
+    if not metrics_enabled():
+        return tools
+    return [
+        InstrumentedTool(
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+            inner=tool,
+        )
+        for tool in tools
+    ]
+
+
+class BudgetedTool(BaseTool):
+    """Wraps a tool so it stops doing work once the festival's time budget is used up."""
+
+    inner: BaseTool
+
+    def _generate_description(self):
+        self.description = self.inner.description
+
+    def _run(self, **kwargs: Any) -> Any:
+        if budget_exhausted():
+            mark_cut_short()
+            return BUDGET_EXHAUSTED_MESSAGE
+        return self.inner._run(**kwargs)
+
+    async def _arun(self, **kwargs: Any) -> Any:
+        if budget_exhausted():
+            mark_cut_short()
+            return BUDGET_EXHAUSTED_MESSAGE
+        return await arun_tool(self.inner, kwargs)
+
+
+def budget_tools(tools: List[BaseTool]) -> List[BaseTool]:
+    """Wrap ``tools`` to honour the per-festival time budget (see timeouts.festival_budget).
+
+    Always wraps: the budget is set per festival at run time, after the crew's
+    tools are built.
+    """
+    return [
+        BudgetedTool(
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+            inner=tool,
+        )
+        for tool in tools
+    ]
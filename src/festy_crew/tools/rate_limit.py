@@ -0,0 +1,145 @@
+import asyncio
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+# Requests per second allowed by Hunter's API, per endpoint
+DEFAULT_RATES = {
+    "hunter/domain-search": 15.0,
+    "hunter/email-verifier": 10.0,
+}
+FALLBACK_RATE = 5.0
+
+
+class TokenBucket:
+    """Token-bucket limiter shared by threads and asyncio tasks.
+
+    Callers reserve a token under a short lock and then sleep outside it
+    (``acquire`` with time.sleep, ``acquire_async`` with asyncio.sleep), so an
+    event loop is never blocked on the lock. ``pause`` stops all callers until
+    a deadline, which is how a 429 Retry-After is honoured process-wide; the
+    bucket refills from the end of the pause, so queued callers resume at the
+    normal rate instead of all at once.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token, returning how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            if now > self._updated:  # _updated is in the future while paused
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return (self._updated - now) + wait
+
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if now > self._updated:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._paused_until = max(self._paused_until, now + seconds)
+            # No refill during the pause, and one request's worth of burst after it
+            self._tokens = min(self._tokens, 1.0)
+            self._updated = max(self._updated, self._paused_until)
+
+
+_limiters: Dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(endpoint: str) -> TokenBucket:
+    """Return the shared limiter for ``endpoint`` (e.g. "hunter/email-verifier").
+
+    The rate comes from FESTY_RATE_<ENDPOINT> (requests/second, with "/" and
+    "-" replaced by "_", e.g. FESTY_RATE_HUNTER_EMAIL_VERIFIER), then the
+    built-in defaults for the plan.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(endpoint)
+        if limiter is None:
+            env_key = "FESTY_RATE_" + endpoint.upper().replace("/", "_").replace("-", "_")
+            rate = float(os.getenv(env_key, DEFAULT_RATES.get(endpoint, FALLBACK_RATE)))
+            limiter = _limiters[endpoint] = TokenBucket(rate)
+        return limiter
+
+
+def _retry_after_seconds(headers) -> Optional[float]:
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _backoff_delay(response, attempt: int, base_delay: float) -> float:
+    delay = _retry_after_seconds(response.headers)
+    if delay is None:
+        delay = base_delay * (2 ** attempt)
+    return delay + random.uniform(0, base_delay)
+
+
+def call_with_backoff(
+    send: Callable[[], Any],
+    limiter: TokenBucket,
+    max_retries: int = 4,
+    base_delay: float = 1.0,
+):
+    """Issue ``send()`` under ``limiter``, retrying HTTP 429 responses.
+
+    Each retry waits for Retry-After when the server gives one, otherwise
+    exponential backoff; jitter is added either way. The whole bucket is paused
+    for that delay so concurrent callers back off too. The final response is
+    returned as-is, even if it is still a 429.
+    """
+    for attempt in range(max_retries + 1):
+        limiter.acquire()
+        response = send()
+        if response.status_code != 429 or attempt == max_retries:
+            return response
+        limiter.pause(_backoff_delay(response, attempt, base_delay))
+    return response
+
+
+async def call_with_backoff_async(
+    send: Callable[[], Awaitable[Any]],
+    limiter: TokenBucket,
+    max_retries: int = 4,
+    base_delay: float = 1.0,
+):
+    """Async counterpart of call_with_backoff."""
+    for attempt in range(max_retries + 1):
+        await limiter.acquire_async()
+        response = await send()
+        if response.status_code != 429 or attempt == max_retries:
+            return response
+        limiter.pause(_backoff_delay(response, attempt, base_delay))
+    return response
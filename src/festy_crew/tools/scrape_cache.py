@@ -0,0 +1,134 @@
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+DEFAULT_CACHE_PATH = ".festy_cache/scrape_cache.sqlite"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 5000
+
+
+class ScrapeCache:
+    """SQLite-backed URL -> markdown cache with a TTL and LRU eviction.
+
+    Safe to share between threads: a single connection is guarded by a lock.
+    ``refresh`` skips reads but still stores fresh results; ``enabled=False``
+    turns the cache into a no-op.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        enabled: bool = True,
+        refresh: bool = False,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS scrapes ("
+                " url TEXT PRIMARY KEY,"
+                " markdown TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_scrapes_accessed ON scrapes (accessed_at)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, url: str) -> Optional[str]:
+        """Return cached markdown for ``url``, or None on a miss or expiry."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            if self.refresh:
+                self.misses += 1
+                return None
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT markdown, fetched_at FROM scrapes WHERE url = ?", (url,)
+            ).fetchone()
+            now = time.time()
+            if row is None or now - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            conn.execute("UPDATE scrapes SET accessed_at = ? WHERE url = ?", (now, url))
+            conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def set(self, url: str, markdown: str) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            conn = self._connect()
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO scrapes (url, markdown, fetched_at, accessed_at)"
+                " VALUES (?, ?, ?, ?)",
+                (url, markdown, now, now),
+            )
+            # Evict least recently used rows beyond the size cap
+            conn.execute(
+                "DELETE FROM scrapes WHERE url IN ("
+                " SELECT url FROM scrapes ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            conn.commit()
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_cache: Optional[ScrapeCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_scrape_cache() -> ScrapeCache:
+    """Return the process-wide scrape cache, configured from the environment.
+
+    FESTY_CACHE_PATH, FESTY_CACHE_TTL (seconds) and FESTY_CACHE_MAX_ENTRIES
+    override the defaults; FESTY_NO_CACHE=1 disables it.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ScrapeCache(
+                path=os.getenv("FESTY_CACHE_PATH", DEFAULT_CACHE_PATH),
+                ttl_seconds=float(os.getenv("FESTY_CACHE_TTL", DEFAULT_TTL_SECONDS)),
+                max_entries=int(os.getenv("FESTY_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+                enabled=os.getenv("FESTY_NO_CACHE", "") not in ("1", "true", "yes"),
+            )
+        return _cache
+
+
+def configure_scrape_cache(enabled: bool = True, refresh: bool = False) -> ScrapeCache:
+    """Apply command-line overrides (--no-cache / --refresh) to the shared cache."""
+    cache = get_scrape_cache()
+    cache.enabled = enabled
+    cache.refresh = refresh
+    return cache
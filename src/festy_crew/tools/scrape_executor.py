@@ -0,0 +1,164 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import os
+import threading
+import weakref
+from typing import Any, Callable, Optional
+
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_QUEUE = 32
+DEFAULT_QUEUE_TIMEOUT = 30.0
+
+
+class ScrapeRejectedError(RuntimeError):
+    """Raised when the scrape executor is saturated and the queue wait expires."""
+
+
+class ScrapeExecutor:
+    """Process-wide bounded thread pool for blocking scrape calls.
+
+    At most ``max_workers`` scrapes run at once and at most ``max_queue`` more
+    wait for a worker. Submitting beyond that blocks for up to ``queue_timeout``
+    seconds, then raises ScrapeRejectedError. Timed-out futures are cancelled so
+    queued work never starts; running work is bounded by the HTTP timeout passed
+    to the client.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        queue_timeout: float = DEFAULT_QUEUE_TIMEOUT,
+    ):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="festy-scrape"
+        )
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._in_flight = 0
+        self.completed = 0
+        self.timed_out = 0
+        self.cancelled = 0
+        self.rejected = 0
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> concurrent.futures.Future:
+        return self.submit_within(self.queue_timeout, fn, *args, **kwargs)
+
+    def submit_within(
+        self, queue_timeout: float, fn: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> concurrent.futures.Future:
+        """submit, waiting at most ``queue_timeout`` seconds (capped at the executor's) for room."""
+        if not self._slots.acquire(timeout=max(min(queue_timeout, self.queue_timeout), 0)):
+            with self._lock:
+                self.rejected += 1
+            raise ScrapeRejectedError(
+                f"Scrape queue full ({self.max_workers} running, {self.max_queue} queued)"
+            )
+
+        # Carry the caller's context (e.g. per-festival state) onto the worker
+        ctx = contextvars.copy_context()
+
+        def task():
+            with self._lock:
+                self._queued -= 1
+                self._in_flight += 1
+            try:
+                return ctx.run(fn, *args, **kwargs)
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+                    self.completed += 1
+
+        with self._lock:
+            self._queued += 1
+        try:
+            future = self._pool.submit(task)
+        except Exception:
+            with self._lock:
+                self._queued -= 1
+            self._slots.release()
+            raise
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: concurrent.futures.Future) -> None:
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+                self.cancelled += 1
+        self._slots.release()
+
+    def abandon(self, future: concurrent.futures.Future) -> None:
+        """Give up on a future: cancel it if not started and count it as timed out."""
+        if future.done():
+            return
+        future.cancel()
+        with self._lock:
+            self.timed_out += 1
+
+    def wait(self, future: concurrent.futures.Future, timeout: float) -> Optional[Any]:
+        """Return the future's result, or None (abandoning it) after ``timeout`` seconds."""
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            self.abandon(future)
+            return None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "in_flight": self._in_flight,
+                "queued": self._queued,
+                "completed": self.completed,
+                "timed_out": self.timed_out,
+                "cancelled": self.cancelled,
+                "rejected": self.rejected,
+            }
+
+
+_executor: Optional[ScrapeExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_scrape_executor() -> ScrapeExecutor:
+    """Return the shared scrape executor, sized from the environment.
+
+    FESTY_SCRAPE_WORKERS, FESTY_SCRAPE_QUEUE and FESTY_SCRAPE_QUEUE_TIMEOUT
+    override the defaults.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ScrapeExecutor(
+                max_workers=int(os.getenv("FESTY_SCRAPE_WORKERS", DEFAULT_MAX_WORKERS)),
+                max_queue=int(os.getenv("FESTY_SCRAPE_QUEUE", DEFAULT_MAX_QUEUE)),
+                queue_timeout=float(os.getenv("FESTY_SCRAPE_QUEUE_TIMEOUT", DEFAULT_QUEUE_TIMEOUT)),
+            )
+        return _executor
+
+
+_async_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_scrape_slots() -> asyncio.Semaphore:
+    """Semaphore bounding concurrent async scrapes on the running loop.
+
+    Sized by FESTY_SCRAPE_WORKERS like the thread pool, so the async tools put
+    no more load on Firecrawl than the threaded ones.
+    """
+    loop = asyncio.get_running_loop()
+    with _executor_lock:
+        slots = _async_slots.get(loop)
+        if slots is None:
+            slots = _async_slots[loop] = asyncio.Semaphore(
+                int(os.getenv("FESTY_SCRAPE_WORKERS", DEFAULT_MAX_WORKERS))
+            )
+        return slots
@@ -0,0 +1,141 @@
+import contextlib
+import contextvars
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Iterator, Optional, Tuple
+
+DEFAULT_TIMEOUT_FLOOR = 3.0
+DEFAULT_TIMEOUT_CEILING = 30.0
+LATENCY_WINDOW = 50  # recent requests per host the p95 is taken over
+MIN_SAMPLES = 5  # below this the caller's fixed default timeout is used
+P95_HEADROOM = 1.5  # timeout = p95 latency x this, clamped to [floor, ceiling]
+
+
+class DeadlineExceededError(RuntimeError):
+    """The current festival's time budget is used up."""
+
+
+class HostLatency:
+    """Recent request latencies per host, and timeouts derived from their p95.
+
+    Hosts are free-form keys: a website's domain for scrapes, "hunter.<endpoint>"
+    for Hunter. A timed-out request is recorded at its timeout, so a host that
+    keeps timing out gets longer timeouts, up to the ceiling.
+    """
+
+    def __init__(
+        self,
+        floor: float = DEFAULT_TIMEOUT_FLOOR,
+        ceiling: float = DEFAULT_TIMEOUT_CEILING,
+        window: int = LATENCY_WINDOW,
+    ):
+        self.floor = floor
+        self.ceiling = ceiling
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def observe(self, host: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(host)
+            if samples is None:
+                samples = self._samples[host] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def p95(self, host: str) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples.get(host, ()))
+        if len(samples) < MIN_SAMPLES:
+            return None
+        return samples[min(math.ceil(0.95 * len(samples)) - 1, len(samples) - 1)]
+
+    def timeout_for(self, host: str, default: float) -> float:
+        """p95 x headroom within [floor, ceiling]; ``default`` (capped) until there are enough samples."""
+        p95 = self.p95(host)
+        if p95 is None:
+            return min(default, self.ceiling)
+        return min(max(p95 * P95_HEADROOM, self.floor), self.ceiling)
+
+
+_latency: Optional[HostLatency] = None
+_latency_lock = threading.Lock()
+
+
+def get_host_latency() -> HostLatency:
+    """Return the shared HostLatency, clamped by FESTY_TIMEOUT_FLOOR / FESTY_TIMEOUT_CEILING."""
+    global _latency
+    with _latency_lock:
+        if _latency is None:
+            _latency = HostLatency(
+                floor=float(os.getenv("FESTY_TIMEOUT_FLOOR", DEFAULT_TIMEOUT_FLOOR)),
+                ceiling=float(os.getenv("FESTY_TIMEOUT_CEILING", DEFAULT_TIMEOUT_CEILING)),
+            )
+        return _latency
+
+
+class _Budget:
+    __slots__ = ("deadline", "cut_short")
+
+    def __init__(self, deadline: float):
+        self.deadline = deadline  # monotonic time the festival must finish by
+        self.cut_short = False  # some request or tool call was stopped by the deadline
+
+
+# The current festival's budget; executor workers inherit it and share the object
+_budget: contextvars.ContextVar[Optional[_Budget]] = contextvars.ContextVar(
+    "festival_budget", default=None
+)
+
+
+@contextlib.contextmanager
+def festival_budget(seconds: Optional[float]) -> Iterator[None]:
+    """Give the enclosed festival ``seconds`` of tool time in total; None or 0 = unlimited."""
+    token = _budget.set(_Budget(time.monotonic() + seconds) if seconds else None)
+    try:
+        yield
+    finally:
+        _budget.reset(token)
+
+
+def budget_remaining() -> Optional[float]:
+    """Seconds left in the current festival's budget, or None without one."""
+    budget = _budget.get()
+    return None if budget is None else budget.deadline - time.monotonic()
+
+
+def budget_exhausted() -> bool:
+    remaining = budget_remaining()
+    return remaining is not None and remaining <= 0
+
+
+def mark_cut_short() -> None:
+    """Record that the deadline stopped a request or tool call of the current festival."""
+    budget = _budget.get()
+    if budget is not None:
+        budget.cut_short = True
+
+
+def budget_cut_short() -> bool:
+    """True if the deadline stopped any of the current festival's work, so its result is partial."""
+    budget = _budget.get()
+    return budget is not None and budget.cut_short
+
+
+def request_timeout(host: str, default: float) -> Tuple[float, bool]:
+    """Timeout for a request to ``host``: adaptive, then cut to the festival's remaining budget.
+
+    Returns (timeout, clipped); ``clipped`` means the budget, not the host's
+    latency, set the timeout, so a timeout says nothing about the host.
+    Raises DeadlineExceededError when the budget is already used up.
+    """
+    timeout = get_host_latency().timeout_for(host, default)
+    remaining = budget_remaining()
+    if remaining is None or remaining >= timeout:
+        return timeout, False
+    if remaining <= 0:
+        mark_cut_short()
+        raise DeadlineExceededError("this festival's time budget is used up")
+    return remaining, True
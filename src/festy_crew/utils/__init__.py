@@ -1,7 +1,18 @@
-from festy_crew.utils.csv_handler import (
-    enriched_to_csv,
-    festivals_to_csv,
-    load_approved_festivals,
-)
+# Re-exports resolve lazily so importing a light helper (festival_key, metrics)
+# doesn't pull in pandas through csv_handler
+_EXPORTS = {
+    "festivals_to_csv": "festy_crew.utils.csv_handler",
+    "extract_festivals": "festy_crew.utils.csv_handler",
+    "load_approved_festivals": "festy_crew.utils.csv_handler",
+    "enriched_to_csv": "festy_crew.utils.csv_handler",
+}
 
-__all__ = ["festivals_to_csv", "load_approved_festivals", "enriched_to_csv"]
+__all__ = ["festivals_to_csv", "extract_festivals", "load_approved_festivals", "enriched_to_csv"]
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        import importlib
+
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
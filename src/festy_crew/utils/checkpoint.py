@@ -0,0 +1,75 @@
+import json
+import time
+from pathlib import Path
+from typing import List, Optional
+
+
+DEFAULT_RUNS_DIR = "runs"
+
+
+class RunCheckpoint:
+    """Persists each crew task's output to a run directory as it finishes.
+
+    Layout::
+
+        <run_dir>/manifest.json      inputs and the names of completed tasks
+        <run_dir>/<task_name>.md     raw task output
+        <run_dir>/<task_name>.json   structured (pydantic) output, when present
+    """
+
+    def __init__(self, run_dir: str, inputs: Optional[dict] = None):
+        self.run_dir = Path(run_dir)
+        self.run_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self._read_manifest()
+        self.inputs = inputs if inputs is not None else manifest.get("inputs", {})
+        self._completed: List[str] = manifest.get("completed", [])
+        self._write_manifest()
+
+    @classmethod
+    def new(cls, prefix: str, inputs: dict, runs_dir: str = DEFAULT_RUNS_DIR) -> "RunCheckpoint":
+        """Create a fresh, timestamped run directory under ``runs_dir``."""
+        run_dir = Path(runs_dir) / f"{prefix}-{time.strftime('%Y%m%d-%H%M%S')}"
+        return cls(str(run_dir), inputs)
+
+    @classmethod
+    def resume(cls, run_dir: str) -> "RunCheckpoint":
+        if not (Path(run_dir) / "manifest.json").exists():
+            raise FileNotFoundError(f"No checkpoint manifest found in {run_dir}")
+        return cls(run_dir)
+
+    def _read_manifest(self) -> dict:
+        path = self.run_dir / "manifest.json"
+        if not path.exists():
+            return {}
+        return json.loads(path.read_text())
+
+    def _write_manifest(self) -> None:
+        manifest = {"inputs": self.inputs, "completed": self._completed}
+        tmp = self.run_dir / "manifest.json.tmp"
+        tmp.write_text(json.dumps(manifest, indent=2))
+        tmp.replace(self.run_dir / "manifest.json")
+
+    def save(self, task_name: str, raw: str, structured: Optional[dict] = None) -> None:
+        (self.run_dir / f"{task_name}.md").write_text(raw or "")
+        if structured is not None:
+            (self.run_dir / f"{task_name}.json").write_text(json.dumps(structured, indent=2))
+        if task_name not in self._completed:
+            self._completed.append(task_name)
+        self._write_manifest()
+
+    def save_task_output(self, output) -> None:
+        """CrewAI task callback: persist a TaskOutput under its task name."""
+        name = getattr(output, "name", None) or f"task_{len(self._completed) + 1}"
+        pydantic_out = getattr(output, "pydantic", None)
+        structured = pydantic_out.model_dump() if pydantic_out is not None else None
+        self.save(name, output.raw, structured)
+
+    def is_complete(self, task_name: str) -> bool:
+        return task_name in self._completed
+
+    def load_raw(self, task_name: str) -> str:
+        return (self.run_dir / f"{task_name}.md").read_text()
+
+    def load_structured(self, task_name: str) -> Optional[dict]:
+        path = self.run_dir / f"{task_name}.json"
+        return json.loads(path.read_text()) if path.exists() else None
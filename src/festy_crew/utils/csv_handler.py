@@ -1,14 +1,82 @@
-import json
-import re
-from typing import List
+from pathlib import Path
+from typing import List, Optional, Set, Union
 
 import pandas as pd
 
 from festy_crew.models.festival import EnrichedContact, Festival, FestivalList, IndividualContact
+from festy_crew.utils.festival_key import festival_key
+from festy_crew.utils.json_salvage import salvage_festivals
 
 
-def festivals_to_csv(crew_output, output_path: str) -> pd.DataFrame:
-    """Convert ResearchCrew output to CSV. Tries pydantic first, falls back to parsing raw text."""
+# What phase 2 needs to enrich a festival; the long text columns are left on disk
+ENRICH_COLUMNS = ["name", "country", "location", "website", "festival_key", "Approved"]
+# Rows per Parquet row group / CSV chunk; filtered reads stream through the file in these
+PARQUET_ROW_GROUP = 10_000
+
+
+def parquet_path(path: str) -> str:
+    """The Parquet file written next to ``path`` (same name, .parquet suffix)."""
+    return str(Path(path).with_suffix(".parquet"))
+
+
+def _is_parquet(path) -> bool:
+    return str(path).lower().endswith(".parquet")
+
+
+def _write_parquet(df: pd.DataFrame, path: str) -> None:
+    try:
+        df.astype("string").to_parquet(path, index=False, row_group_size=PARQUET_ROW_GROUP)
+    except ImportError:
+        print("Warning: pyarrow is not installed (pip install 'festy-crew[parquet]'); skipping Parquet output.")
+        return
+    print(f"Saved a Parquet copy to {path}")
+
+
+def read_festival_table(
+    path: str, columns: Optional[List[str]] = None, approved_only: bool = False
+) -> pd.DataFrame:
+    """Read a festival CSV or Parquet file, loading only ``columns`` if given.
+
+    Unwanted columns are never parsed. With ``approved_only`` rows are filtered
+    a chunk (or Parquet row group) at a time, so unapproved rows are dropped
+    while reading instead of after the whole file is in memory.
+    """
+    if _is_parquet(path):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(path)
+        names = parquet.schema_arrow.names
+        wanted = None if columns is None else [c for c in columns if c in names]
+        if not (approved_only and "Approved" in names):
+            return parquet.read(columns=wanted).to_pandas()
+        # Filter one row group at a time so only approved rows are ever held
+        batches = []
+        for batch in parquet.iter_batches(columns=wanted, batch_size=PARQUET_ROW_GROUP):
+            approved = pc.utf8_lower(pc.utf8_trim_whitespace(batch.column("Approved")))
+            batches.append(batch.filter(pc.equal(approved, "yes")))
+        schema = parquet.schema_arrow if wanted is None else pa.schema([parquet.schema_arrow.field(c) for c in wanted])
+        return pa.Table.from_batches(batches, schema=schema).to_pandas()
+
+    usecols = None if columns is None else (lambda c: c in columns)
+    if not approved_only:
+        return pd.read_csv(path, usecols=usecols)
+    chunks = []
+    with pd.read_csv(path, usecols=usecols, chunksize=PARQUET_ROW_GROUP) as reader:
+        for chunk in reader:
+            if "Approved" in chunk.columns:
+                chunk = chunk[chunk["Approved"].fillna("").astype(str).str.strip().str.lower() == "yes"]
+            chunks.append(chunk)
+    return pd.concat(chunks) if chunks else pd.read_csv(path, usecols=usecols)
+
+
+def extract_festivals(crew_output) -> List[Festival]:
+    """Pull festivals out of ResearchCrew output (or a FestivalList). Tries pydantic first,
+    falls back to parsing raw text."""
+    if isinstance(crew_output, FestivalList):
+        return crew_output.festivals
+
     festivals: List[Festival] = []
 
     # Try pydantic output first
@@ -21,57 +89,83 @@ def festivals_to_csv(crew_output, output_path: str) -> pd.DataFrame:
     if not festivals and hasattr(crew_output, "raw") and crew_output.raw:
         festivals = _parse_raw_festivals(crew_output.raw)
 
+    return festivals
+
+
+def festivals_to_csv(
+    crew_output,
+    output_path: str,
+    approved_keys: Optional[Set[str]] = None,
+    parquet: bool = False,
+) -> pd.DataFrame:
+    """Convert ResearchCrew output (or a merged FestivalList) to CSV.
+
+    Festivals whose key is in ``approved_keys`` (approved in an earlier run)
+    come out with "Yes" already in the Approved column. With ``parquet`` a
+    Parquet copy is written next to the CSV.
+    """
+    festivals = extract_festivals(crew_output)
+
     if not festivals:
         print("Warning: No festivals found in crew output. Creating empty CSV.")
         df = pd.DataFrame(
             columns=[
                 "name", "country", "location", "dates", "genres", "website",
                 "description", "genre_fit_score", "why_it_fits", "known_acts",
-                "submission_info", "Approved",
+                "submission_info", "festival_key", "Approved",
             ]
         )
         df.to_csv(output_path, index=False)
+        if parquet:
+            _write_parquet(df, parquet_path(output_path))
         return df
 
     records = [f.model_dump() for f in festivals]
     df = pd.DataFrame(records)
-    df["Approved"] = ""
+    df["festival_key"] = [festival_key(f.name, f.website) for f in festivals]
+    df["Approved"] = ["Yes" if key in (approved_keys or ()) else "" for key in df["festival_key"]]
     df.to_csv(output_path, index=False)
     print(f"Saved {len(df)} festivals to {output_path}")
+    if parquet:
+        _write_parquet(df, parquet_path(output_path))
     return df
 
 
 def _parse_raw_festivals(raw_text: str) -> List[Festival]:
-    """Attempt to extract festival data from raw LLM text output."""
-    festivals = []
-
-    # Try JSON block extraction
-    json_match = re.search(r"```(?:json)?\s*(\{[\s\S]*?\}|\[[\s\S]*?\])\s*```", raw_text)
-    if json_match:
-        try:
-            data = json.loads(json_match.group(1))
-            if isinstance(data, dict) and "festivals" in data:
-                return FestivalList(**data).festivals
-            if isinstance(data, list):
-                return FestivalList(festivals=data).festivals
-        except Exception:
-            pass
-
-    # Try bare JSON
-    try:
-        data = json.loads(raw_text.strip())
-        if isinstance(data, dict) and "festivals" in data:
-            return FestivalList(**data).festivals
-    except Exception:
-        pass
-
+    """Extract festival data from raw LLM text output, reporting entries it must skip."""
+    festivals, problems = salvage_festivals(raw_text)
+    if problems:
+        print(f"Warning: skipped {len(problems)} festival entries in the raw crew output:")
+        for problem in problems:
+            print(f"  - {problem}")
     return festivals
 
 
-def load_approved_festivals(csv_path: str) -> List[dict]:
-    """Load festivals from CSV where Approved column is 'Yes' (case-insensitive)."""
+def _ensure_festival_key(df: pd.DataFrame) -> None:
+    """Fill in festival_key for CSVs written before the column existed."""
+    if df.empty or "name" not in df.columns:
+        return
+    if "festival_key" not in df.columns:
+        df["festival_key"] = None
+    missing = df["festival_key"].isna()
+    if not missing.any():
+        return
+    websites = df.loc[missing, "website"] if "website" in df.columns else [""] * int(missing.sum())
+    df.loc[missing, "festival_key"] = [
+        festival_key(n, w) for n, w in zip(df.loc[missing, "name"], websites)
+    ]
+
+
+def load_approved_festivals(csv_path: str, columns: Optional[List[str]] = None) -> List[dict]:
+    """Load festivals from a CSV or Parquet file where Approved is 'Yes' (case-insensitive).
+
+    ``columns`` limits which columns are read (e.g. ENRICH_COLUMNS); name,
+    website and festival_key are always included.
+    """
+    if columns is not None:
+        columns = list(dict.fromkeys([*columns, "name", "website", "festival_key", "Approved"]))
     try:
-        df = pd.read_csv(csv_path)
+        df = read_festival_table(csv_path, columns=columns, approved_only=True)
     except FileNotFoundError:
         print(f"Error: CSV file not found at {csv_path}")
         return []
@@ -83,34 +177,49 @@ def load_approved_festivals(csv_path: str) -> List[dict]:
         )
         return []
 
-    approved = df[df["Approved"].fillna("").str.strip().str.lower() == "yes"]
-    records = approved.to_dict(orient="records")
+    _ensure_festival_key(df)
+    records = df.to_dict(orient="records")
     print(f"Loaded {len(records)} approved festivals from {csv_path}")
     return records
 
 
 def enriched_to_csv(
-    contacts: List[EnrichedContact], original_csv: str, output_path: str
+    contacts: List[EnrichedContact],
+    original_csv: Union[str, pd.DataFrame],
+    output_path: str,
+    festival_keys: Optional[List[str]] = None,
+    parquet: bool = False,
 ) -> pd.DataFrame:
     """Merge enriched contact data with the original festival CSV.
 
     Expands to one row per individual contact. Festival metadata is repeated
-    across rows for the same festival.
+    across rows for the same festival. When ``festival_keys`` (parallel to
+    ``contacts``) is given the join uses the stable festival key, so festivals
+    sharing a display name don't fan out; otherwise it falls back to ``name``.
+
+    ``original_csv`` may also be a Parquet file or a DataFrame of festival
+    rows, e.g. read from the festival store. With ``parquet`` a Parquet copy
+    (without the disclaimer row) is written next to the output CSV.
     """
     try:
-        original_df = pd.read_csv(original_csv)
+        if isinstance(original_csv, pd.DataFrame):
+            original_df = original_csv.copy()
+        else:
+            original_df = read_festival_table(original_csv)
     except FileNotFoundError:
         print(f"Warning: Original CSV not found at {original_csv}. Creating standalone output.")
         original_df = pd.DataFrame()
 
     rows = []
-    for enriched in contacts:
+    for i, enriched in enumerate(contacts):
         base = {
             "name": enriched.festival_name,
             "Confidence": enriched.confidence,
             "Source": enriched.source,
             "Notes": enriched.notes,
         }
+        if festival_keys is not None:
+            base["festival_key"] = festival_keys[i]
         if enriched.contacts:
             for person in enriched.contacts:
                 rows.append({
@@ -134,12 +243,20 @@ def enriched_to_csv(
         print("No enriched contacts to save.")
         return contacts_df
 
-    if not original_df.empty and "name" in original_df.columns:
+    if festival_keys is not None and not original_df.empty and "name" in original_df.columns:
+        _ensure_festival_key(original_df)
+        original_df = original_df.drop_duplicates(subset="festival_key")
+        merged = original_df.merge(
+            contacts_df.drop(columns=["name"]), on="festival_key", how="left"
+        )
+    elif not original_df.empty and "name" in original_df.columns:
         merged = original_df.merge(contacts_df, on="name", how="left")
     else:
         merged = contacts_df
 
     merged.to_csv(output_path, index=False)
+    if parquet:
+        _write_parquet(merged, parquet_path(output_path))
 
     # Append disclaimer as a comment row
     with open(output_path, "a") as f:
@@ -0,0 +1,172 @@
+import re
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, List
+
+from festy_crew.models.festival import Festival
+from festy_crew.utils.festival_key import normalize_domain, normalize_name
+
+
+# Hosts shared by unrelated festivals; a matching domain here proves nothing
+SHARED_HOSTS = {
+    "facebook.com", "m.facebook.com", "instagram.com", "twitter.com", "x.com",
+    "youtube.com", "linktr.ee", "tiktok.com", "eventbrite.com", "peatix.com",
+    "ticketmelon.com", "songkick.com", "residentadvisor.net", "ra.co",
+    "en.wikipedia.org", "musicfestivalwizard.com", "bandwagon.asia",
+}
+
+# Words that don't distinguish one festival from another
+_NOISE_WORDS = {"the", "festival", "fest", "music", "edition", "official"}
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+
+NAME_THRESHOLD = 0.88  # similarity needed to merge on name alone
+DOMAIN_NAME_THRESHOLD = 0.5  # looser similarity needed when domains match
+MAX_BLOCK_SIZE = 200  # blocks larger than this are too generic to compare pairwise
+
+_FIT_RANK = {"high": 3, "medium": 2, "low": 1}
+
+
+def _core_name(name: str) -> str:
+    """Name reduced to its distinguishing words: no years, case, or filler words."""
+    words = _YEAR_RE.sub(" ", normalize_name(name)).split()
+    core = [w for w in words if w not in _NOISE_WORDS]
+    return " ".join(core or words)
+
+
+def _blocking_keys(core: str) -> List[str]:
+    """Cheap keys; only records sharing a key are compared.
+
+    A prefix of each word catches reordering and suffix changes; the squashed
+    first characters catch spacing differences ("summersonic").
+    """
+    words = core.split()
+    keys = {f"w:{w[:4]}" for w in words if len(w) >= 3}
+    squashed = core.replace(" ", "")
+    if squashed:
+        keys.add(f"s:{squashed[:5]}")
+    return sorted(keys)
+
+
+def _similar(a: str, b: str, threshold: float) -> bool:
+    if a == b:
+        return True
+    # ratio() can never exceed 2*min/(len_a+len_b); skip hopeless pairs cheaply
+    if 2 * min(len(a), len(b)) < threshold * (len(a) + len(b)):
+        return False
+    matcher = SequenceMatcher(None, a, b)
+    return matcher.real_quick_ratio() >= threshold and matcher.quick_ratio() >= threshold and (
+        matcher.ratio() >= threshold
+    )
+
+
+class _UnionFind:
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> None:
+        ri, rj = self.find(i), self.find(j)
+        if ri != rj:
+            self.parent[max(ri, rj)] = min(ri, rj)
+
+
+def _is_blank(value: str) -> bool:
+    return not value or value.strip().lower() in ("unknown", "n/a", "tba", "none", "")
+
+
+def _merge_list_field(values: List[str]) -> str:
+    """Union comma-separated values (genres, acts), keeping first-seen order."""
+    seen: Dict[str, str] = {}
+    for value in values:
+        if _is_blank(value):
+            continue
+        for item in value.split(","):
+            item = item.strip()
+            if item and item.lower() not in seen:
+                seen[item.lower()] = item
+    return ", ".join(seen.values())
+
+
+def _completeness(festival: Festival) -> int:
+    return sum(not _is_blank(str(v)) for v in festival.model_dump().values())
+
+
+def merge_festivals(group: List[Festival]) -> Festival:
+    """Combine duplicate records field by field.
+
+    The most complete record wins scalar fields, with blanks filled from the
+    others; genres and known acts are unioned, the longest description and
+    rationale are kept, and the best genre fit score is taken.
+    """
+    ordered = sorted(group, key=_completeness, reverse=True)
+    merged = ordered[0].model_dump()
+    for field in merged:
+        values = [getattr(f, field) for f in ordered]
+        if field in ("genres", "known_acts"):
+            merged[field] = _merge_list_field(values) or merged[field]
+        elif field in ("description", "why_it_fits", "submission_info"):
+            merged[field] = max(values, key=lambda v: (not _is_blank(v), len(v or "")))
+        elif field == "genre_fit_score":
+            merged[field] = max(values, key=lambda v: _FIT_RANK.get((v or "").lower(), 0))
+        elif _is_blank(merged[field]):
+            merged[field] = next((v for v in values if not _is_blank(v)), merged[field])
+    return Festival(**merged)
+
+
+def dedupe_festivals(festivals: List[Festival]) -> List[Festival]:
+    """Collapse duplicate festivals, preserving the order of first appearance.
+
+    Records are linked when they share a website domain (outside SHARED_HOSTS)
+    and have loosely similar names, or when their names are near-identical and
+    countries agree. Name comparisons only happen within blocking-key buckets,
+    so the cost grows with bucket sizes rather than with every pair.
+    """
+    n = len(festivals)
+    if n < 2:
+        return list(festivals)
+
+    cores = [_core_name(f.name) for f in festivals]
+    countries = [normalize_name(f.country) for f in festivals]
+    uf = _UnionFind(n)
+
+    by_domain: Dict[str, List[int]] = defaultdict(list)
+    blocks: Dict[str, List[int]] = defaultdict(list)
+    for i, festival in enumerate(festivals):
+        domain = normalize_domain(festival.website)
+        if domain and domain not in SHARED_HOSTS:
+            by_domain[domain].append(i)
+        for key in _blocking_keys(cores[i]):
+            blocks[key].append(i)
+
+    for members in by_domain.values():
+        for a in range(len(members)):
+            for b in range(a + 1, len(members)):
+                i, j = members[a], members[b]
+                if _similar(cores[i], cores[j], DOMAIN_NAME_THRESHOLD):
+                    uf.union(i, j)
+
+    compared = set()
+    for members in blocks.values():
+        if len(members) > MAX_BLOCK_SIZE:
+            continue
+        for a in range(len(members)):
+            for b in range(a + 1, len(members)):
+                i, j = members[a], members[b]
+                if (i, j) in compared or uf.find(i) == uf.find(j):
+                    continue
+                compared.add((i, j))
+                ci, cj = countries[i], countries[j]
+                if (not ci or not cj or ci == cj) and _similar(cores[i], cores[j], NAME_THRESHOLD):
+                    uf.union(i, j)
+
+    groups: Dict[int, List[Festival]] = defaultdict(list)
+    for i, festival in enumerate(festivals):
+        groups[uf.find(i)].append(festival)
+    # Roots are the smallest index in each group, so this keeps first-seen order
+    return [merge_festivals(groups[root]) if len(groups[root]) > 1 else groups[root][0]
+            for root in sorted(groups)]
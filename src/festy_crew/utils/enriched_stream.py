@@ -0,0 +1,59 @@
+import json
+import os
+import threading
+from typing import Dict
+
+from festy_crew.models.festival import EnrichedContact
+
+
+class EnrichedStreamWriter:
+    """Append-only JSONL log of per-festival enrichment results.
+
+    Each finished festival is written as one line and fsynced immediately, so a
+    crash loses at most the festival in progress. Safe to call from several
+    worker threads.
+    """
+
+    def __init__(self, path: str, append: bool = True):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a" if append else "w", encoding="utf-8")
+
+    def write(self, key: str, contact: EnrichedContact) -> None:
+        line = json.dumps({"festival_key": key, "contact": contact.model_dump()}, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "EnrichedStreamWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def load_enriched_stream(path: str) -> Dict[str, EnrichedContact]:
+    """Read a stream written by EnrichedStreamWriter, keyed by festival key.
+
+    A truncated final line (from a crash mid-write) is ignored. Later entries for
+    the same festival replace earlier ones.
+    """
+    results: Dict[str, EnrichedContact] = {}
+    if not os.path.exists(path):
+        return results
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+                results[entry["festival_key"]] = EnrichedContact(**entry["contact"])
+            except (ValueError, KeyError, TypeError):
+                continue
+    return results
@@ -0,0 +1,35 @@
+import hashlib
+import re
+import unicodedata
+from urllib.parse import urlparse
+
+
+def normalize_name(name) -> str:
+    """Lowercase, accent-fold and collapse punctuation/whitespace in a festival name."""
+    if not isinstance(name, str):
+        return ""
+    text = unicodedata.normalize("NFKD", name)
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+    return " ".join(re.sub(r"[^\w]+", " ", text).split())
+
+
+def normalize_domain(url) -> str:
+    """Reduce a website URL to its bare lowercase host, without "www."."""
+    if not isinstance(url, str) or not url.strip():
+        return ""
+    url = url.strip().lower()
+    if "//" not in url:
+        url = f"//{url}"
+    host = urlparse(url).hostname or ""
+    return host[4:] if host.startswith("www.") else host
+
+
+def festival_key(name, website) -> str:
+    """Stable identifier for a festival, derived from its name and website domain.
+
+    Unlike the display name it survives formatting differences ("Summer Sonic"
+    vs "summer sonic") and distinguishes different festivals that happen to share
+    a name but not a website.
+    """
+    basis = f"{normalize_name(name)}|{normalize_domain(website)}"
+    return hashlib.sha1(basis.encode("utf-8")).hexdigest()[:16]
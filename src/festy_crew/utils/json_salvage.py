@@ -0,0 +1,141 @@
+import json
+import re
+from typing import List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from festy_crew.models.festival import Festival
+
+FESTIVAL_FIELDS = set(Festival.model_fields)
+MIN_SHARED_FIELDS = 2  # an object needs "name" plus this many Festival fields to count
+
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_SPECIAL_RE = re.compile(r'[{}"\\]')
+_KEY_COLON_RE = re.compile(r"\s*:")
+
+
+class JsonObject:
+    """One ``{...}`` span found by scan_json_objects, with the objects nested in it."""
+
+    __slots__ = ("start", "end", "has_name", "children")
+
+    def __init__(self, start: int):
+        self.start = start
+        self.end: Optional[int] = None  # offset past the closing brace; None if truncated
+        self.has_name = False  # the object itself (not a child) has a "name" key
+        self.children: List["JsonObject"] = []
+
+    @property
+    def closed(self) -> bool:
+        return self.end is not None
+
+    def text(self, source: str) -> str:
+        return source[self.start:self.end]
+
+
+def scan_json_objects(text: str) -> List[JsonObject]:
+    """The top-level ``{...}`` objects in ``text``, each with its nested objects.
+
+    A single pass tracks brace depth and JSON string state, so braces inside
+    strings are ignored, and so are quotes in prose outside any object. Objects
+    still open at the end of the text (truncated output) are returned with
+    ``end=None``.
+    """
+    roots: List[JsonObject] = []
+    stack: List[JsonObject] = []
+    in_string = False
+    string_start = 0
+    skip_to = -1
+    # Only braces, quotes and backslashes matter; jump straight between them
+    for match in _SPECIAL_RE.finditer(text):
+        i, ch = match.start(), match.group()
+        if i < skip_to:
+            continue  # character escaped by a preceding backslash
+        if in_string:
+            if ch == "\\":
+                skip_to = i + 2
+            elif ch == '"':
+                in_string = False
+                if i - string_start == 5 and text[string_start:i + 1] == '"name"':
+                    if _KEY_COLON_RE.match(text, i + 1):
+                        stack[-1].has_name = True
+        elif ch == '"' and stack:
+            in_string = True
+            string_start = i
+        elif ch == "{":
+            obj = JsonObject(i)
+            (stack[-1].children if stack else roots).append(obj)
+            stack.append(obj)
+        elif ch == "}" and stack:
+            stack.pop().end = i + 1
+    return roots
+
+
+def _load_object(fragment: str):
+    for candidate in (fragment, _TRAILING_COMMA_RE.sub(r"\1", fragment)):
+        try:
+            return json.loads(candidate, strict=False)
+        except ValueError:
+            continue
+    return None
+
+
+def _coerce(value) -> str:
+    """Flatten the non-string values LLMs like to emit (lists, numbers, null)."""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ", ".join(_coerce(v) for v in value if v is not None)
+    if isinstance(value, dict):
+        return "; ".join(f"{k}: {_coerce(v)}" for k, v in value.items() if v is not None)
+    return value if isinstance(value, str) else str(value)
+
+
+def _label(fragment: str) -> str:
+    match = re.search(r'"name"\s*:\s*"([^"]*)', fragment)
+    return f'"{match.group(1)}"' if match else "unnamed entry"
+
+
+def salvage_festivals(raw_text: str) -> Tuple[List[Festival], List[str]]:
+    """Recover every Festival-shaped object from raw LLM output.
+
+    Works on several fenced blocks, bare JSON, partial arrays and text with
+    prose around it. Each object with its own "name" key is validated on its
+    own, nested values included, so one bad entry doesn't sink the rest. An
+    object that becomes a festival is parsed once and its children are skipped;
+    otherwise the objects inside it are tried, so every character reaches the
+    JSON parser once per level of nesting. Returns the festivals and a list of
+    problems, one per candidate that looked like a festival but could not be used.
+    """
+    festivals: List[Festival] = []
+    problems: List[str] = []
+    pending = list(reversed(scan_json_objects(raw_text)))
+    while pending:
+        obj = pending.pop()
+        if obj.has_name:
+            festival, problem = _festival_from(obj, raw_text)
+            if festival is not None:
+                festivals.append(festival)
+                continue
+            if problem:
+                problems.append(problem)
+        pending.extend(reversed(obj.children))
+    return festivals, problems
+
+
+def _festival_from(obj: JsonObject, raw_text: str) -> Tuple[Optional[Festival], Optional[str]]:
+    """(festival, None), or (None, problem); (None, None) if ``obj`` isn't festival-shaped."""
+    fragment = obj.text(raw_text)
+    where = f"{_label(fragment)} at offset {obj.start}"
+    if not obj.closed:
+        return None, f"{where}: truncated before the closing brace"
+    data = _load_object(fragment)
+    if not isinstance(data, dict):
+        return None, f"{where}: not valid JSON"
+    if len(FESTIVAL_FIELDS & data.keys()) < MIN_SHARED_FIELDS + 1:
+        return None, None
+    try:
+        return Festival(**{k: _coerce(v) for k, v in data.items() if k in FESTIVAL_FIELDS}), None
+    except ValidationError as e:
+        missing = [".".join(map(str, err["loc"])) for err in e.errors()]
+        return None, f"{where}: invalid or missing {', '.join(missing)}"
@@ -0,0 +1,202 @@
+import bisect
+import contextlib
+import contextvars
+import json
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# Upper bounds (seconds) of the latency histogram buckets; the last is open-ended
+LATENCY_BUCKETS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 40]
+AGGREGATE = "_all"
+
+_enabled = False
+_scope: contextvars.ContextVar[str] = contextvars.ContextVar("festy_metrics_scope", default="")
+
+
+class _Stat:
+    __slots__ = (
+        "calls", "errors", "timeouts", "cancelled", "bytes", "cache_hits", "cache_misses",
+        "total_seconds", "max_seconds", "histogram", "tokens",
+    )
+
+    def __init__(self):
+        self.calls = self.errors = self.timeouts = self.cancelled = self.bytes = 0
+        self.cache_hits = self.cache_misses = 0
+        self.total_seconds = self.max_seconds = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.tokens: Dict[str, int] = defaultdict(int)
+
+    def to_dict(self) -> dict:
+        out = {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "cancelled": self.cancelled,
+            "bytes": self.bytes,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "total_seconds": round(self.total_seconds, 3),
+            "mean_seconds": round(self.total_seconds / self.calls, 3) if self.calls else 0.0,
+            "max_seconds": round(self.max_seconds, 3),
+            "histogram": {
+                f"<={b}s" if i < len(LATENCY_BUCKETS) else f">{LATENCY_BUCKETS[-1]}s": n
+                for i, (b, n) in enumerate(zip(LATENCY_BUCKETS + [None], self.histogram))
+                if n
+            },
+        }
+        if self.tokens:
+            out["tokens"] = dict(self.tokens)
+        return out
+
+
+_lock = threading.Lock()
+_stats: Dict[str, Dict[str, _Stat]] = defaultdict(lambda: defaultdict(_Stat))
+
+
+def _targets(name: str) -> List[_Stat]:
+    scope = _scope.get()
+    stats = [_stats[AGGREGATE][name]]
+    if scope:
+        stats.append(_stats[scope][name])
+    return stats
+
+
+class _Timer:
+    """Times one call; set ``bytes``/``timeout``/``cache_hit`` before it exits."""
+
+    __slots__ = ("name", "start", "bytes", "timeout", "cache_hit", "error")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.bytes = 0
+        self.timeout = False
+        self.cache_hit = None
+        self.error = False
+
+    def __enter__(self) -> "_Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        elapsed = time.perf_counter() - self.start
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, elapsed)
+        with _lock:
+            for stat in _targets(self.name):
+                stat.calls += 1
+                stat.errors += bool(exc_type) or self.error
+                stat.timeouts += self.timeout
+                stat.bytes += self.bytes
+                if self.cache_hit is not None:
+                    stat.cache_hits += self.cache_hit
+                    stat.cache_misses += not self.cache_hit
+                stat.total_seconds += elapsed
+                stat.max_seconds = max(stat.max_seconds, elapsed)
+                stat.histogram[bucket] += 1
+        return False
+
+
+class _NoopTimer:
+    """Stand-in used while metrics are off; attribute writes are simply discarded."""
+
+    def __enter__(self) -> "_NoopTimer":
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+    def __setattr__(self, name, value) -> None:
+        pass
+
+
+_NOOP = _NoopTimer()
+
+
+def enable_metrics(enabled: bool = True) -> None:
+    global _enabled
+    _enabled = enabled
+
+
+def metrics_enabled() -> bool:
+    return _enabled
+
+
+def timed(name: str):
+    """Context manager recording one call of ``name``; near-free when metrics are off."""
+    return _Timer(name) if _enabled else _NOOP
+
+
+def count(name: str, field: str, n: int = 1) -> None:
+    """Bump a counter (e.g. "timeouts", "cancelled", "cache_hits") without timing a call."""
+    if not _enabled:
+        return
+    with _lock:
+        for stat in _targets(name):
+            setattr(stat, field, getattr(stat, field) + n)
+
+
+def record_tokens(name: str, usage: Any) -> None:
+    """Add LLM token usage (a crewai UsageMetrics or dict) to ``name``."""
+    if not _enabled or usage is None:
+        return
+    values = usage if isinstance(usage, dict) else getattr(usage, "model_dump", lambda: {})()
+    with _lock:
+        for stat in _targets(name):
+            for key in ("total_tokens", "prompt_tokens", "completion_tokens", "successful_requests"):
+                stat.tokens[key] += int(values.get(key) or 0)
+
+
+@contextlib.contextmanager
+def metrics_scope(scope: str):
+    """Attribute metrics recorded in this context (and scrape workers) to ``scope``."""
+    token = _scope.set(scope)
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def snapshot() -> dict:
+    with _lock:
+        scopes = {
+            scope: {name: stat.to_dict() for name, stat in sorted(stats.items())}
+            for scope, stats in _stats.items()
+        }
+    return {"aggregate": scopes.pop(AGGREGATE, {}), "by_festival": scopes}
+
+
+def write_metrics(path: str) -> None:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps(snapshot(), indent=2, ensure_ascii=False))
+
+
+def summary_lines(limit: int = 10, report: Optional[dict] = None) -> List[str]:
+    """Short report of the stages that took the most total time.
+
+    Summarises this process's metrics, or a saved ``report`` when one is given.
+    """
+    aggregate = (report or snapshot())["aggregate"]
+    ranked = sorted(aggregate.items(), key=lambda kv: kv[1]["total_seconds"], reverse=True)
+    lines = []
+    for name, stat in ranked[:limit]:
+        extras = []
+        if stat["timeouts"]:
+            extras.append(f"{stat['timeouts']} timeouts")
+        if stat.get("cancelled"):
+            extras.append(f"{stat['cancelled']} cancelled")
+        if stat["errors"]:
+            extras.append(f"{stat['errors']} errors")
+        if stat["cache_hits"] or stat["cache_misses"]:
+            extras.append(f"{stat['cache_hits']}/{stat['cache_hits'] + stat['cache_misses']} cached")
+        if "tokens" in stat:
+            extras.append(f"{stat['tokens'].get('total_tokens', 0)} tokens")
+        suffix = f" ({', '.join(extras)})" if extras else ""
+        lines.append(
+            f"  {name:<32} {stat['calls']:>5} calls  {stat['total_seconds']:>9.1f}s total  "
+            f"{stat['mean_seconds']:>6.2f}s mean{suffix}"
+        )
+    return lines
+
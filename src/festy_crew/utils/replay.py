@@ -0,0 +1,229 @@
+import asyncio
+import atexit
+import hashlib
+import json
+import os
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from crewai.llms.base_llm import BaseLLM
+from crewai.tools import BaseTool
+from crewai.utilities.llm_utils import create_llm
+
+
+class CassetteMissError(KeyError):
+    """Raised in replay mode when a call was never recorded."""
+
+
+def _key(kind: str, payload: Any) -> str:
+    blob = json.dumps([kind, payload], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _canonical_messages(messages) -> Any:
+    if isinstance(messages, str):
+        return [{"role": "user", "content": messages}]
+    return [{"role": m.get("role"), "content": m.get("content")} for m in messages]
+
+
+class Cassette:
+    """Thread-safe store of recorded LLM and tool calls, persisted as one JSON file.
+
+    In record mode calls run for real and their responses are captured; in
+    replay mode they are served from the file with no network. Lookups are by
+    a hash of the prompt messages (LLM) or the tool name and arguments, so
+    concurrent festivals or shards replay correctly in any order. Repeated
+    identical calls are served in the order they were recorded.
+    """
+
+    def __init__(self, path: str, mode: str):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._entries: List[dict] = []
+        self._index: Dict[str, List[Any]] = defaultdict(list)
+        self._served: Dict[str, int] = defaultdict(int)
+        if mode == "replay":
+            if not self.path.exists():
+                raise FileNotFoundError(f"Cassette not found: {path}")
+            for entry in json.loads(self.path.read_text())["entries"]:
+                self._entries.append(entry)
+                self._index[entry["key"]].append(entry["response"])
+
+    def _replay(self, kind: str, key: str) -> Any:
+        with self._lock:
+            recorded = self._index.get(key)
+            if not recorded:
+                raise CassetteMissError(f"No recording for {kind} call ({key[:12]})")
+            n = self._served[key]
+            self._served[key] = n + 1
+        # Calls repeated more often than recorded get the last recording
+        return recorded[min(n, len(recorded) - 1)]
+
+    def _record(self, kind: str, key: str, request: Any, response: Any) -> Any:
+        with self._lock:
+            self._entries.append(
+                {"key": key, "kind": kind, "request": request, "response": response}
+            )
+        return response
+
+    def call(self, kind: str, request: Any, fn: Callable[[], Any]) -> Any:
+        """Serve ``kind``/``request`` from the cassette, or run ``fn`` and record it."""
+        key = _key(kind, request)
+        if self.mode == "replay":
+            return self._replay(kind, key)
+        return self._record(kind, key, request, fn())
+
+    async def acall(self, kind: str, request: Any, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Async ``call``: ``fn`` returns an awaitable, which only runs when recording."""
+        key = _key(kind, request)
+        if self.mode == "replay":
+            return self._replay(kind, key)
+        return self._record(kind, key, request, await fn())
+
+    def save(self) -> None:
+        if self.mode != "record":
+            return
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp.write_text(
+                json.dumps({"version": 1, "entries": self._entries}, ensure_ascii=False, default=str)
+            )
+            tmp.replace(self.path)
+
+
+_cassette: Optional[Cassette] = None
+
+
+def configure_cassette(record: Optional[str] = None, replay: Optional[str] = None) -> Optional[Cassette]:
+    """Enable record or replay mode for this process (at most one of them)."""
+    global _cassette
+    if record and replay:
+        raise ValueError("Choose either record or replay, not both")
+    if replay:
+        _cassette = Cassette(replay, "replay")
+        # Nothing should leave the machine during a replay
+        os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+        os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+    elif record:
+        _cassette = Cassette(record, "record")
+        atexit.register(_cassette.save)
+    else:
+        _cassette = None
+    return _cassette
+
+
+def get_cassette() -> Optional[Cassette]:
+    return _cassette
+
+
+def cassette_call(kind: str, request: Any, fn: Callable[[], Any]) -> Any:
+    """Route a call through the active cassette; a plain ``fn()`` when none is set."""
+    if _cassette is None:
+        return fn()
+    return _cassette.call(kind, request, fn)
+
+
+async def cassette_call_async(kind: str, request: Any, fn: Callable[[], Awaitable[Any]]) -> Any:
+    """Async cassette_call; a plain ``await fn()`` when no cassette is set."""
+    if _cassette is None:
+        return await fn()
+    return await _cassette.acall(kind, request, fn)
+
+
+async def arun_tool(tool: BaseTool, kwargs: Dict[str, Any]) -> Any:
+    """Await ``tool``'s ``_arun``, or run its ``_run`` on a thread if it only has a sync one."""
+    arun = getattr(tool, "_arun", None)
+    if arun is None:
+        return await asyncio.to_thread(tool._run, **kwargs)
+    return await arun(**kwargs)
+
+
+class CassetteLLM(BaseLLM):
+    """LLM that records a real model's completions, or replays them offline.
+
+    Function calling is reported as unsupported so that structured-output
+    conversion also goes through ``call`` and ends up on the cassette.
+    """
+
+    def __init__(self, inner: Optional[BaseLLM] = None):
+        self.inner = inner
+        super().__init__(model=getattr(inner, "model", None) or "cassette-replay")
+        self.stop = list(getattr(inner, "stop", None) or [])
+
+    def call(
+        self,
+        messages,
+        tools=None,
+        callbacks=None,
+        available_functions=None,
+        from_task=None,
+        from_agent=None,
+    ):
+        def live():
+            response = self.inner.call(
+                messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions,
+                from_task=from_task,
+                from_agent=from_agent,
+            )
+            return response if isinstance(response, str) else str(response)
+
+        return cassette_call("llm", _canonical_messages(messages), live)
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+    def supports_stop_words(self) -> bool:
+        return self.inner.supports_stop_words() if self.inner else True
+
+    def get_context_window_size(self) -> int:
+        return self.inner.get_context_window_size() if self.inner else 128_000
+
+
+class CassetteTool(BaseTool):
+    """Wraps a tool so its calls are recorded to, or replayed from, the cassette."""
+
+    inner: BaseTool
+
+    def _generate_description(self):
+        # The wrapped tool's description is already fully rendered
+        self.description = self.inner.description
+
+    def _run(self, **kwargs: Any) -> Any:
+        return cassette_call(f"tool:{self.name}", kwargs, lambda: self.inner._run(**kwargs))
+
+    async def _arun(self, **kwargs: Any) -> Any:
+        return await cassette_call_async(
+            f"tool:{self.name}", kwargs, lambda: arun_tool(self.inner, kwargs)
+        )
+
+
+def crew_llm() -> Optional[BaseLLM]:
+    """LLM for crew agents: a cassette LLM when recording/replaying, else None (default)."""
+    if _cassette is None:
+        return None
+    if _cassette.mode == "replay":
+        return CassetteLLM()
+    return CassetteLLM(create_llm(os.getenv("MODEL") or None))
+
+
+def wrap_tools(tools: List[BaseTool]) -> List[BaseTool]:
+    if _cassette is None:
+        return tools
+    return [
+        CassetteTool(
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+            inner=tool,
+        )
+        for tool in tools
+    ]
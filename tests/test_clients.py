@@ -0,0 +1,77 @@
+"""Checks that Firecrawl pooling still fits the installed firecrawl-py.
+
+_pool_firecrawl relies on firecrawl-py internals (the v2 HttpClient calling
+module-level ``requests``). These tests fail if those move, instead of
+Firecrawl silently falling back to a new connection per request.
+
+Run with: python -m unittest discover tests (or pytest tests)
+"""
+
+import json
+import socket
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    from firecrawl import Firecrawl
+except ImportError:  # firecrawl-py not installed
+    Firecrawl = None
+
+from festy_crew.tools.clients import _pool_firecrawl, get_http_session
+
+
+class _StubFirecrawl(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections open between requests
+    connections = set()
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        _StubFirecrawl.connections.add(self.client_address)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps({"success": True, "data": {"markdown": "# Contact"}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@unittest.skipIf(Firecrawl is None, "firecrawl-py is not installed")
+class FirecrawlPoolingTest(unittest.TestCase):
+    def setUp(self):
+        _StubFirecrawl.connections = set()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubFirecrawl)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.api_url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _scrape(self, app, n: int) -> int:
+        before = len(_StubFirecrawl.connections)
+        for _ in range(n):
+            self.assertEqual(app.scrape("https://fest.example").markdown, "# Contact")
+        return len(_StubFirecrawl.connections) - before
+
+    def test_pooled_client_reuses_one_connection(self):
+        app = Firecrawl(api_key="fc-test", api_url=self.api_url)
+        self.assertTrue(_pool_firecrawl(app, get_http_session("firecrawl-test")))
+        self.assertEqual(self._scrape(app, 3), 1)
+
+    def test_other_clients_are_left_alone(self):
+        pooled = Firecrawl(api_key="fc-test", api_url=self.api_url)
+        _pool_firecrawl(pooled, get_http_session("firecrawl-test"))
+        other = Firecrawl(api_key="fc-test", api_url=self.api_url)
+        self.assertEqual(self._scrape(other, 3), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()